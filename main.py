@@ -4,7 +4,11 @@ Main entry point for Deadlock Detection and Recovery System
 """
 import sys
 import argparse
+import atexit
+import io
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
@@ -13,10 +17,71 @@ from src.interfaces.cli import CLI
 from src.interfaces.config_loader import load_scenario, create_example_scenarios
 from src.interfaces.web_api import start_server
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+
+class _BufferedFileHandler(logging.StreamHandler):
+    """
+    File sink that defers flushing to its buffered stream
+
+    StreamHandler.emit() flushes after every record, which would push
+    the 64 KiB write buffer through to the OS each time and defeat it.
+    Flushing here is a no-op: buffered bytes reach disk when the buffer
+    fills or when the handler is closed at shutdown.
+    """
+
+    def flush(self):
+        pass
+
+    def close(self):
+        # The handler owns its stream; closing it does the one real
+        # flush the per-record no-op above skipped
+        if not self.stream.closed:
+            self.stream.close()
+        super().close()
+
+
+def _setup_logging(level: int = logging.INFO, log_file: str = None):
+    """
+    Route all log records through a background listener thread
+
+    A synchronous StreamHandler would block the simulation loop on
+    every stderr write; with a QueueHandler the hot path only enqueues
+    and the listener thread does the formatting and I/O. An optional
+    file sink writes through a 64 KiB buffer so many small records
+    collapse into one syscall.
+    """
+    log_queue = queue.SimpleQueue()
+    formatter = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(formatter)
+    handlers = [stream_handler]
+
+    if log_file:
+        buffered = open(log_file, 'ab', buffering=64 * 1024)
+        file_stream = io.TextIOWrapper(buffered, encoding='utf-8')
+        file_handler = _BufferedFileHandler(file_stream)
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.handlers = [QueueHandler(log_queue)]
+
+    listener = QueueListener(log_queue, *handlers)
+    listener.start()
+
+    def _shutdown():
+        # Drain the queue first, then close the sinks (the file sink's
+        # only real flush happens in close)
+        listener.stop()
+        for handler in handlers:
+            handler.close()
+
+    atexit.register(_shutdown)
+
+
 logger = logging.getLogger(__name__)
 
 
@@ -47,14 +112,18 @@ Examples:
     parser.add_argument('--port', type=int, default=5000, help='Port for web server')
     parser.add_argument('--host', type=str, default='0.0.0.0', help='Host for web server')
     parser.add_argument('--debug', action='store_true', help='Enable debug mode')
+    parser.add_argument('--log-file', type=str, help='Write logs to this file through a 64 KiB buffer')
     parser.add_argument('--generate-scenarios', action='store_true', help='Generate example scenarios')
     parser.add_argument('--version', action='version', version='Deadlock Detection System v1.0.0')
     
     args = parser.parse_args()
-    
-    if args.debug:
-        logging.getLogger().setLevel(logging.DEBUG)
-    
+
+    # Configure logging exactly once, with the resolved options
+    _setup_logging(
+        level=logging.DEBUG if args.debug else logging.INFO,
+        log_file=args.log_file
+    )
+
     if args.generate_scenarios:
         logger.info("Generating example scenarios...")
         create_example_scenarios()
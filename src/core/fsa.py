@@ -1,20 +1,25 @@
 """
 Base Finite State Automaton implementation
 """
-from typing import Any, Dict, Optional
+from collections import deque
+from types import MappingProxyType
+from typing import Any, Dict, Optional, Tuple
 from dataclasses import dataclass
 import logging
 import time
 
 logger = logging.getLogger(__name__)
 
+# Bound once to avoid module-global attribute lookups in the hot path
+_time = time.time
+
 
 class FSAException(Exception):
     """Base exception for FSA errors"""
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Transition:
     """Represents a state transition"""
     from_state: str
@@ -45,20 +50,97 @@ class FiniteStateAutomaton:
         alphabet: set,
         transition_function: Dict[tuple, str],
         initial_state: str,
-        accepting_states: set = None
+        accepting_states: set = None,
+        record_history: bool = False,
+        history_size: int = 1024,
+        _skip_validate: bool = False,
+        _compiled: Tuple = None
     ):
         self.name = name
         self.states = states
         self.alphabet = alphabet
         self.transition_function = transition_function
         self.initial_state = initial_state
-        self.current_state = initial_state
         self.accepting_states = accepting_states or set()
-        self.transition_history = []
-        
-        # Validate FSA definition
-        self._validate()
-    
+        self.transition_history = (
+            deque(maxlen=history_size) if record_history else None
+        )
+
+        # Validate FSA definition (skipped for pre-validated templates)
+        if not _skip_validate:
+            self._validate()
+
+        # Compile to an integer-indexed 2-D transition table so each
+        # transition is a single indexed load instead of tuple allocation
+        # plus dict lookups (shared via the template where possible)
+        if _compiled is None:
+            _compiled = _compile_transition_table(
+                states, alphabet, transition_function
+            )
+        self._state_names, self._state_index, self._symbol_index, self._table = _compiled
+        self._state_i = self._state_index[initial_state]
+
+    @property
+    def current_state(self) -> str:
+        """Current state name (backed by an integer state index)"""
+        return self._state_names[self._state_i]
+
+    @classmethod
+    def from_template(
+        cls,
+        name: str,
+        template: Tuple,
+        record_history: bool = False
+    ) -> 'FiniteStateAutomaton':
+        """
+        Create an FSA from a template pre-validated by make_fsa_template.
+
+        Skips per-instance validation and table compilation since the
+        shared definition was already processed once at import time.
+        """
+        (states, alphabet, transition_function,
+         initial_state, accepting_states, compiled) = template
+        return cls(
+            name=name,
+            states=states,
+            alphabet=alphabet,
+            transition_function=transition_function,
+            initial_state=initial_state,
+            accepting_states=accepting_states,
+            record_history=record_history,
+            _skip_validate=True,
+            _compiled=compiled
+        )
+
+    def __deepcopy__(self, memo):
+        """Clone runtime state while sharing the immutable definition
+
+        The definition (states, alphabet, transition function — a
+        read-only mapping for template-built FSAs — and the compiled
+        table) is never mutated, so clones share it; only the current
+        state index and history are per-instance.
+        """
+        cls = self.__class__
+        clone = cls.__new__(cls)
+        clone.name = self.name
+        clone.states = self.states
+        clone.alphabet = self.alphabet
+        clone.transition_function = self.transition_function
+        clone.initial_state = self.initial_state
+        clone.accepting_states = self.accepting_states
+        clone.transition_history = (
+            deque(self.transition_history,
+                  maxlen=self.transition_history.maxlen)
+            if self.transition_history is not None else None
+        )
+        clone._state_names = self._state_names
+        clone._state_index = self._state_index
+        clone._symbol_index = self._symbol_index
+        clone._table = self._table
+        clone._state_i = self._state_i
+        memo[id(self)] = clone
+        return clone
+
     def _validate(self):
         """Validate FSA definition"""
         if self.initial_state not in self.states:
@@ -90,57 +172,132 @@ class FiniteStateAutomaton:
         Raises:
             FSAException: If transition is invalid
         """
-        if input_symbol not in self.alphabet:
+        symbol_i = self._symbol_index.get(input_symbol)
+        if symbol_i is None:
             raise FSAException(
                 f"Invalid input symbol '{input_symbol}' for FSA '{self.name}'"
             )
-        
-        transition_key = (self.current_state, input_symbol)
-        
-        if transition_key not in self.transition_function:
+
+        next_i = self._table[self._state_i][symbol_i]
+
+        if next_i < 0:
             raise FSAException(
                 f"No transition defined from state '{self.current_state}' "
                 f"with input '{input_symbol}' for FSA '{self.name}'"
             )
-        
-        next_state = self.transition_function[transition_key]
-        
-        # Record transition
-        trans = Transition(
-            from_state=self.current_state,
-            to_state=next_state,
-            input_symbol=input_symbol,
-            timestamp=time.time(),
-            metadata=metadata
-        )
-        self.transition_history.append(trans)
-        
-        logger.debug(
-            f"FSA '{self.name}': {self.current_state} --({input_symbol})--> {next_state}"
-        )
-        
+
+        from_state = self._state_names[self._state_i]
+        next_state = self._state_names[next_i]
+
+        # Record transition only when history is enabled
+        if self.transition_history is not None:
+            self.transition_history.append(Transition(
+                from_state=from_state,
+                to_state=next_state,
+                input_symbol=input_symbol,
+                timestamp=_time(),
+                metadata=metadata
+            ))
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "FSA '%s': %s --(%s)--> %s",
+                self.name, from_state, input_symbol, next_state
+            )
+
         # Update state
-        self.current_state = next_state
+        self._state_i = next_i
         return next_state
     
     def reset(self):
         """Reset FSA to initial state"""
-        self.current_state = self.initial_state
-        self.transition_history = []
-        logger.info(f"FSA '{self.name}' reset to initial state '{self.initial_state}'")
+        self._state_i = self._state_index[self.initial_state]
+        if self.transition_history is not None:
+            self.transition_history.clear()
+        logger.info("FSA '%s' reset to initial state '%s'", self.name, self.initial_state)
     
     def is_in_accepting_state(self) -> bool:
         """Check if current state is an accepting state"""
         return self.current_state in self.accepting_states
     
-    def get_transition_history(self) -> list:
-        """Get list of all transitions"""
-        return self.transition_history.copy()
+    def get_transition_history(self):
+        """
+        Get a view of recorded transitions (empty if history is disabled)
+
+        The returned view reflects live mutation and costs O(1); use
+        get_transition_history_snapshot for an independent copy.
+        """
+        return self.transition_history if self.transition_history is not None else ()
+
+    def get_transition_history_snapshot(self) -> tuple:
+        """Get an immutable point-in-time copy of the transition history"""
+        return tuple(self.transition_history or ())
     
     def __repr__(self):
         return (
             f"FSA(name='{self.name}', "
             f"current_state='{self.current_state}', "
             f"states={len(self.states)}, "
-            f"transitions={len(self.transition_history)})"
-        )
\ No newline at end of file
+            f"transitions={len(self.transition_history or ())})"
+        )
+
+
+def _compile_transition_table(
+    states: set,
+    alphabet: set,
+    transition_function: Dict[tuple, str]
+) -> Tuple:
+    """
+    Compile a transition function into an integer-indexed 2-D table.
+
+    Returns (state_names, state_index, symbol_index, table) where
+    table[state_i][symbol_i] is the next state index or -1 if the
+    transition is undefined.
+    """
+    state_names = tuple(sorted(states))
+    state_index = {name: i for i, name in enumerate(state_names)}
+    symbol_index = {sym: i for i, sym in enumerate(sorted(alphabet))}
+
+    table = [[-1] * len(symbol_index) for _ in state_names]
+    for (state, symbol), next_state in transition_function.items():
+        table[state_index[state]][symbol_index[symbol]] = state_index[next_state]
+
+    return state_names, state_index, symbol_index, tuple(map(tuple, table))
+
+
+def make_fsa_template(
+    states: set,
+    alphabet: set,
+    transition_function: Dict[tuple, str],
+    initial_state: str,
+    accepting_states: set = None
+) -> Tuple:
+    """
+    Build and validate a shareable FSA definition once.
+
+    Returns a frozen template tuple suitable for
+    FiniteStateAutomaton.from_template, so classes that spawn many
+    identical automata (Process, Resource) pay the validation cost a
+    single time at import instead of on every construction.
+    """
+    template = (
+        frozenset(states),
+        frozenset(alphabet),
+        MappingProxyType(dict(transition_function)),
+        initial_state,
+        frozenset(accepting_states or ()),
+        _compile_transition_table(states, alphabet, transition_function)
+    )
+
+    # Validate once; from_template instances skip this
+    FiniteStateAutomaton(
+        name="_template_validation",
+        states=template[0],
+        alphabet=template[1],
+        transition_function=template[2],
+        initial_state=template[3],
+        accepting_states=template[4],
+        _compiled=template[5]
+    )
+
+    return template
\ No newline at end of file
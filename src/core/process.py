@@ -3,15 +3,46 @@ Process class with integrated FSA for state management
 """
 from typing import List, Set
 from dataclasses import dataclass, field
+import sys
 import time
-from .fsa import FiniteStateAutomaton
+from .fsa import FiniteStateAutomaton, make_fsa_template
 
 
-@dataclass
+# Process FSA definition, shared by all instances and validated once
+_STATES = {'Ready', 'Running', 'Blocked', 'Deadlocked', 'Terminated'}
+
+_ALPHABET = {
+    'start', 'request', 'allocate', 'deny',
+    'detect_cycle', 'terminate', 'resume'
+}
+
+# Transition function: (state, input) -> next_state
+_TRANSITIONS = {
+    ('Ready', 'start'): 'Running',
+    ('Running', 'request'): 'Running',
+    ('Running', 'allocate'): 'Running',
+    ('Running', 'deny'): 'Blocked',
+    ('Running', 'terminate'): 'Terminated',
+    ('Blocked', 'allocate'): 'Running',
+    ('Blocked', 'detect_cycle'): 'Deadlocked',
+    ('Deadlocked', 'terminate'): 'Terminated',
+    ('Deadlocked', 'resume'): 'Blocked',
+}
+
+_FSA_TEMPLATE = make_fsa_template(
+    states=_STATES,
+    alphabet=_ALPHABET,
+    transition_function=_TRANSITIONS,
+    initial_state='Ready',
+    accepting_states={'Terminated'}
+)
+
+
+@dataclass(slots=True)
 class Process:
     """
     Represents a process in the system
-    
+
     Attributes:
         pid: Process identifier
         priority: Priority level (1=highest, 10=lowest)
@@ -28,37 +59,21 @@ class Process:
     creation_time: float = field(default_factory=time.time)
     blocked_time: float = 0
     victim_count: int = 0  # Times terminated as victim
-    
+    # Membership shadow for O(1) requested_resources lookups
+    _requested_set: Set[str] = field(default_factory=set, init=False, repr=False)
+    # Serialization cache, invalidated on any state mutation
+    _dict_cache: dict = field(default=None, init=False, repr=False)
+    _dirty: bool = field(default=True, init=False, repr=False)
+    # Declared so the class can use __slots__; assigned in __post_init__
+    fsa: FiniteStateAutomaton = field(init=False, repr=False)
+
     def __post_init__(self):
-        """Initialize Process FSA"""
-        # Define Process FSA
-        states = {'Ready', 'Running', 'Blocked', 'Deadlocked', 'Terminated'}
-        
-        alphabet = {
-            'start', 'request', 'allocate', 'deny', 
-            'detect_cycle', 'terminate', 'resume'
-        }
-        
-        # Transition function: (state, input) -> next_state
-        transitions = {
-            ('Ready', 'start'): 'Running',
-            ('Running', 'request'): 'Running',
-            ('Running', 'allocate'): 'Running',
-            ('Running', 'deny'): 'Blocked',
-            ('Running', 'terminate'): 'Terminated',
-            ('Blocked', 'allocate'): 'Running',
-            ('Blocked', 'detect_cycle'): 'Deadlocked',
-            ('Deadlocked', 'terminate'): 'Terminated',
-            ('Deadlocked', 'resume'): 'Blocked',
-        }
-        
-        self.fsa = FiniteStateAutomaton(
-            name=f"Process-{self.pid}",
-            states=states,
-            alphabet=alphabet,
-            transition_function=transitions,
-            initial_state='Ready',
-            accepting_states={'Terminated'}
+        """Initialize Process FSA from the shared template"""
+        # Interned IDs make dict/set ops a pointer compare on the hot path
+        self.pid = sys.intern(self.pid)
+        self._requested_set = set(self.requested_resources)
+        self.fsa = FiniteStateAutomaton.from_template(
+            f"Process-{self.pid}", _FSA_TEMPLATE
         )
     
     @property
@@ -68,28 +83,38 @@ class Process:
     
     def transition(self, event: str, metadata: dict = None):
         """Trigger FSA state transition"""
+        self._dirty = True
         return self.fsa.transition(event, metadata)
     
     def request_resource(self, resource_id: str):
         """Request a resource"""
-        if resource_id not in self.requested_resources:
+        resource_id = sys.intern(resource_id)
+        if resource_id not in self._requested_set:
+            self._requested_set.add(resource_id)
             self.requested_resources.append(resource_id)
+            self._dirty = True
     
     def allocate_resource(self, resource_id: str):
         """Allocate resource to this process"""
+        resource_id = sys.intern(resource_id)
         self.held_resources.add(resource_id)
-        if resource_id in self.requested_resources:
+        self._dirty = True
+        if resource_id in self._requested_set:
+            self._requested_set.discard(resource_id)
             self.requested_resources.remove(resource_id)
     
     def release_resource(self, resource_id: str):
         """Release a held resource"""
         if resource_id in self.held_resources:
             self.held_resources.remove(resource_id)
+            self._dirty = True
     
     def release_all_resources(self):
         """Release all held resources"""
-        released = self.held_resources.copy()
-        self.held_resources.clear()
+        # Swap in a fresh set instead of copy+clear: O(1) vs O(k)
+        released = self.held_resources
+        self.held_resources = set()
+        self._dirty = True
         return released
     
     def get_elapsed_time(self) -> float:
@@ -105,13 +130,19 @@ class Process:
     
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization"""
-        return {
-            'pid': self.pid,
-            'state': self.state,
-            'priority': self.priority,
-            'execution_time': self.execution_time,
-            'held_resources': list(self.held_resources),
-            'requested_resources': self.requested_resources,
-            'elapsed_time': self.get_elapsed_time(),
-            'victim_count': self.victim_count
-        }
\ No newline at end of file
+        # The stable portion is cached until the next mutation; only
+        # elapsed_time is refreshed per call
+        if self._dirty or self._dict_cache is None:
+            self._dict_cache = {
+                'pid': self.pid,
+                'state': self.state,
+                'priority': self.priority,
+                'execution_time': self.execution_time,
+                'held_resources': list(self.held_resources),
+                'requested_resources': list(self.requested_resources),
+                'elapsed_time': 0.0,
+                'victim_count': self.victim_count
+            }
+            self._dirty = False
+        self._dict_cache['elapsed_time'] = self.get_elapsed_time()
+        return self._dict_cache
\ No newline at end of file
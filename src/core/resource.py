@@ -4,10 +4,29 @@ Resource class with integrated FSA for state management
 from typing import Set
 from dataclasses import dataclass, field
 from collections import deque
-from .fsa import FiniteStateAutomaton
+import sys
+from .fsa import FiniteStateAutomaton, make_fsa_template
 
 
-@dataclass
+# Resource FSA definition (simplified for single-instance), shared by
+# all instances and validated once
+_STATES = {'Free', 'Allocated'}
+_ALPHABET = {'allocate', 'release'}
+
+_TRANSITIONS = {
+    ('Free', 'allocate'): 'Allocated',
+    ('Allocated', 'release'): 'Free',
+}
+
+_FSA_TEMPLATE = make_fsa_template(
+    states=_STATES,
+    alphabet=_ALPHABET,
+    transition_function=_TRANSITIONS,
+    initial_state='Free'
+)
+
+
+@dataclass(slots=True)
 class Resource:
     """
     Represents a system resource
@@ -26,26 +45,22 @@ class Resource:
     available_instances: int = field(init=False)
     allocated_to: Set[str] = field(default_factory=set)
     wait_queue: deque = field(default_factory=deque)
-    
+    # Membership shadow for O(1) wait-queue lookups
+    _wait_set: Set[str] = field(default_factory=set, init=False, repr=False)
+    # Serialization cache, invalidated on any state mutation
+    _dict_cache: dict = field(default=None, init=False, repr=False)
+    _dirty: bool = field(default=True, init=False, repr=False)
+    # Declared so the class can use __slots__; assigned in __post_init__
+    fsa: FiniteStateAutomaton = field(init=False, repr=False)
+
     def __post_init__(self):
-        """Initialize Resource FSA"""
+        """Initialize Resource FSA from the shared template"""
+        # Interned IDs make dict/set ops a pointer compare on the hot path
+        self.rid = sys.intern(self.rid)
         self.available_instances = self.total_instances
-        
-        # Define Resource FSA (simplified for single-instance)
-        states = {'Free', 'Allocated'}
-        alphabet = {'allocate', 'release'}
-        
-        transitions = {
-            ('Free', 'allocate'): 'Allocated',
-            ('Allocated', 'release'): 'Free',
-        }
-        
-        self.fsa = FiniteStateAutomaton(
-            name=f"Resource-{self.rid}",
-            states=states,
-            alphabet=alphabet,
-            transition_function=transitions,
-            initial_state='Free'
+        self._wait_set = set(self.wait_queue)
+        self.fsa = FiniteStateAutomaton.from_template(
+            f"Resource-{self.rid}", _FSA_TEMPLATE
         )
     
     @property
@@ -68,7 +83,8 @@ class Resource:
             return False
         
         self.available_instances -= 1
-        self.allocated_to.add(process_id)
+        self.allocated_to.add(sys.intern(process_id))
+        self._dirty = True
         
         # Update FSA if transitioning from Free to Allocated
         if self.available_instances == 0 and self.fsa.current_state == 'Free':
@@ -88,6 +104,7 @@ class Resource:
         
         self.allocated_to.remove(process_id)
         self.available_instances += 1
+        self._dirty = True
         
         # Update FSA if transitioning from Allocated to Free
         if self.available_instances == self.total_instances and self.fsa.current_state == 'Allocated':
@@ -97,13 +114,18 @@ class Resource:
     
     def add_to_wait_queue(self, process_id: str):
         """Add process to wait queue"""
-        if process_id not in self.wait_queue:
+        process_id = sys.intern(process_id)
+        if process_id not in self._wait_set:
+            self._wait_set.add(process_id)
             self.wait_queue.append(process_id)
+            self._dirty = True
     
     def remove_from_wait_queue(self, process_id: str):
         """Remove process from wait queue"""
-        if process_id in self.wait_queue:
+        if process_id in self._wait_set:
+            self._wait_set.discard(process_id)
             self.wait_queue.remove(process_id)
+            self._dirty = True
     
     def __repr__(self):
         return (
@@ -114,12 +136,15 @@ class Resource:
     
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization"""
-        return {
-            'rid': self.rid,
-            'state': self.state,
-            'total_instances': self.total_instances,
-            'available_instances': self.available_instances,
-            'resource_type': self.resource_type,
-            'allocated_to': list(self.allocated_to),
-            'wait_queue': list(self.wait_queue)
-        }
\ No newline at end of file
+        if self._dirty or self._dict_cache is None:
+            self._dict_cache = {
+                'rid': self.rid,
+                'state': self.state,
+                'total_instances': self.total_instances,
+                'available_instances': self.available_instances,
+                'resource_type': self.resource_type,
+                'allocated_to': list(self.allocated_to),
+                'wait_queue': list(self.wait_queue)
+            }
+            self._dirty = False
+        return self._dict_cache
\ No newline at end of file
@@ -1,37 +1,43 @@
 """
 Global system state FSA
 """
-from .fsa import FiniteStateAutomaton
+from .fsa import FiniteStateAutomaton, make_fsa_template
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# System FSA definition, shared and validated once
+_STATES = {'Safe', 'Deadlock', 'Recovering'}
+_ALPHABET = {'cycle_detected', 'recovery_start', 'recovery_complete'}
+
+_TRANSITIONS = {
+    ('Safe', 'cycle_detected'): 'Deadlock',
+    ('Deadlock', 'recovery_start'): 'Recovering',
+    ('Recovering', 'recovery_complete'): 'Safe',
+}
+
+_FSA_TEMPLATE = make_fsa_template(
+    states=_STATES,
+    alphabet=_ALPHABET,
+    transition_function=_TRANSITIONS,
+    initial_state='Safe',
+    accepting_states={'Safe'}
+)
+
+
 class SystemState:
     """
     Global system state controller using FSA
-    
+
     Tracks overall system health (Safe, Deadlock, Recovering)
     """
-    
+
     def __init__(self):
-        """Initialize System FSA"""
-        states = {'Safe', 'Deadlock', 'Recovering'}
-        alphabet = {'cycle_detected', 'recovery_start', 'recovery_complete'}
-        
-        transitions = {
-            ('Safe', 'cycle_detected'): 'Deadlock',
-            ('Deadlock', 'recovery_start'): 'Recovering',
-            ('Recovering', 'recovery_complete'): 'Safe',
-        }
-        
-        self.fsa = FiniteStateAutomaton(
-            name="SystemState",
-            states=states,
-            alphabet=alphabet,
-            transition_function=transitions,
-            initial_state='Safe',
-            accepting_states={'Safe'}
+        """Initialize System FSA from the shared template"""
+        # System transitions are rare, so history stays enabled here
+        self.fsa = FiniteStateAutomaton.from_template(
+            "SystemState", _FSA_TEMPLATE, record_history=True
         )
     
     @property
@@ -4,11 +4,16 @@ Wait-For Graph construction and management
 from typing import Dict, List, Set, Tuple
 from dataclasses import dataclass, field
 import logging
+import sys
 
 logger = logging.getLogger(__name__)
 
+# Process states that participate in the WFG
+_ACTIVE_STATES = frozenset({'Ready', 'Running', 'Blocked', 'Deadlocked'})
+_WAITING_STATES = frozenset({'Blocked', 'Deadlocked'})
 
-@dataclass
+
+@dataclass(slots=True)
 class WaitForGraph:
     """
     Represents a Wait-For Graph for deadlock detection
@@ -17,46 +22,104 @@ class WaitForGraph:
     Edges: (P1, P2) means P1 waits for a resource held by P2
     """
     nodes: Set[str] = field(default_factory=set)
-    edges: List[Tuple[str, str]] = field(default_factory=list)
-    adjacency_list: Dict[str, List[str]] = field(default_factory=dict)
+    edges: Set[Tuple[str, str]] = field(default_factory=set)
+    adjacency_list: Dict[str, Set[str]] = field(default_factory=dict)
+    # Serialization cache, invalidated whenever the graph mutates
+    _to_dict_cache: dict = field(default=None, init=False, repr=False)
     
     def add_node(self, process_id: str):
         """Add a process node to the graph"""
+        # Interned IDs make the hash probes below a pointer compare
+        process_id = sys.intern(process_id)
         self.nodes.add(process_id)
+        self._to_dict_cache = None
         if process_id not in self.adjacency_list:
-            self.adjacency_list[process_id] = []
+            self.adjacency_list[process_id] = set()
     
+    def add_nodes(self, process_ids):
+        """
+        Add many process nodes in one pass
+
+        Bulk set/dict updates grow the containers once for a known-size
+        population instead of rehashing incrementally per add_node call.
+        """
+        process_ids = [sys.intern(pid) for pid in process_ids]
+        self.nodes.update(process_ids)
+        self._to_dict_cache = None
+        adjacency = self.adjacency_list
+        for pid in process_ids:
+            if pid not in adjacency:
+                adjacency[pid] = set()
+
     def add_edge(self, from_process: str, to_process: str):
         """
         Add a directed edge from from_process to to_process
         Meaning: from_process waits for to_process
         """
+        from_process = sys.intern(from_process)
+        to_process = sys.intern(to_process)
+        edge = (from_process, to_process)
+        if edge in self.edges:
+            return
+        
         if from_process not in self.nodes:
             self.add_node(from_process)
         if to_process not in self.nodes:
             self.add_node(to_process)
         
+        self.edges.add(edge)
+        self.adjacency_list[from_process].add(to_process)
+        self._to_dict_cache = None
+
+    def remove_edge(self, from_process: str, to_process: str):
+        """Remove the directed edge from from_process to to_process"""
         edge = (from_process, to_process)
-        if edge not in self.edges:
-            self.edges.append(edge)
-            self.adjacency_list[from_process].append(to_process)
+        if edge in self.edges:
+            self.edges.discard(edge)
+            self.adjacency_list[from_process].discard(to_process)
+            self._to_dict_cache = None
     
-    def get_neighbors(self, process_id: str) -> List[str]:
+    def get_neighbors(self, process_id: str) -> Set[str]:
         """Get all processes that the given process waits for"""
-        return self.adjacency_list.get(process_id, [])
+        return self.adjacency_list.get(process_id, ())
+
+    def to_csr(self) -> Tuple[List[int], List[int], List[str]]:
+        """
+        Export the graph in CSR (compressed sparse row) form
+
+        Returns:
+            (indptr, indices, id_of) where the neighbors of node i are
+            indices[indptr[i]:indptr[i+1]] and id_of maps node index
+            back to process ID. Contiguous integer arrays let detection
+            traverse the graph without per-node dict/string hashing.
+        """
+        id_of = list(self.nodes)
+        node_index = {pid: i for i, pid in enumerate(id_of)}
+
+        indptr = [0]
+        indices = []
+        for pid in id_of:
+            for neighbor in self.adjacency_list.get(pid, []):
+                indices.append(node_index[neighbor])
+            indptr.append(len(indices))
+
+        return indptr, indices, id_of
     
     def clear(self):
         """Clear the graph"""
         self.nodes.clear()
         self.edges.clear()
         self.adjacency_list.clear()
+        self._to_dict_cache = None
     
     def to_dict(self) -> dict:
         """Convert to dictionary for visualization"""
-        return {
-            'nodes': list(self.nodes),
-            'edges': [{'from': e[0], 'to': e[1]} for e in self.edges]
-        }
+        if self._to_dict_cache is None:
+            self._to_dict_cache = {
+                'nodes': list(self.nodes),
+                'edges': [{'from': e[0], 'to': e[1]} for e in self.edges]
+            }
+        return self._to_dict_cache
     
     def __repr__(self):
         return f"WFG(nodes={len(self.nodes)}, edges={len(self.edges)})"
@@ -74,18 +137,25 @@ def build_wait_for_graph(processes: Dict, resources: Dict) -> WaitForGraph:
         WaitForGraph object
     """
     wfg = WaitForGraph()
-    
-    # Add all active processes as nodes
-    for pid, process in processes.items():
-        if process.state not in ['Terminated']:
-            wfg.add_node(pid)
+
+    # Collect the waiting subset once; no waiting process means no edges
+    # and therefore no cycle, so skip node bookkeeping entirely
+    waiting = [
+        (pid, process) for pid, process in processes.items()
+        if process.state in _WAITING_STATES
+    ]
+    if not waiting:
+        logger.info("Built %s", wfg)
+        return wfg
+
+    # Add all active processes as nodes in one bulk update
+    wfg.add_nodes(
+        pid for pid, process in processes.items()
+        if process.state in _ACTIVE_STATES
+    )
     
     # Build edges based on resource dependencies
-    for requesting_pid, requesting_process in processes.items():
-        # Skip if process is not waiting or deadlocked
-        if requesting_process.state not in ['Blocked', 'Deadlocked']:
-            continue
-        
+    for requesting_pid, requesting_process in waiting:
         # Check each requested resource
         for requested_rid in requesting_process.requested_resources:
             if requested_rid not in resources:
@@ -98,10 +168,11 @@ def build_wait_for_graph(processes: Dict, resources: Dict) -> WaitForGraph:
                 if holding_pid in processes and holding_pid != requesting_pid:
                     # Add edge: requesting_pid waits for holding_pid
                     wfg.add_edge(requesting_pid, holding_pid)
+                    # Lazy %-args: no formatting cost unless DEBUG is on
                     logger.debug(
-                        f"WFG edge: {requesting_pid} waits for {holding_pid} "
-                        f"(resource {requested_rid})"
+                        "WFG edge: %s waits for %s (resource %s)",
+                        requesting_pid, holding_pid, requested_rid
                     )
     
-    logger.info(f"Built {wfg}")
+    logger.info("Built %s", wfg)
     return wfg
\ No newline at end of file
@@ -6,10 +6,8 @@ from typing import Optional
 from ..simulation.controller import SimulationController, SimulationConfig
 import logging
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Logging configuration belongs to the entry point (main.py); a library
+# module only gets its logger
 logger = logging.getLogger(__name__)
 
 
@@ -19,6 +17,14 @@ class CLI:
     def __init__(self):
         self.controller: Optional[SimulationController] = None
         self.config = SimulationConfig()
+        # O(1) menu dispatch; new entries only need a table row
+        self._actions = {
+            '1': self._define_scenario,
+            '2': self._load_scenario,
+            '3': self._configure_detection,
+            '4': self._run_simulation,
+            '5': self._view_results,
+        }
     
     def run(self):
         """Main CLI loop"""
@@ -31,34 +37,35 @@ class CLI:
             self._print_menu()
             choice = input("\nEnter choice: ").strip()
             
-            if choice == '1':
-                self._define_scenario()
-            elif choice == '2':
-                self._load_scenario()
-            elif choice == '3':
-                self._configure_detection()
-            elif choice == '4':
-                self._run_simulation()
-            elif choice == '5':
-                self._view_results()
-            elif choice == '6':
+            if choice == '6':
                 print("\nThank you for using Deadlock Detection System!")
                 break
+
+            action = self._actions.get(choice)
+            if action:
+                action()
             else:
                 print("\nInvalid choice. Please try again.")
     
+    # Rendered once; a per-print stdout write (with its lock and
+    # syscall) per menu line adds up under scripted CLI runs
+    _MENU = (
+        "\n" + "=" * 60 + "\n"
+        "MAIN MENU\n"
+        + "=" * 60 + "\n"
+        "[1] Define New Scenario\n"
+        "[2] Load Scenario from File\n"
+        "[3] Configure Detection Settings\n"
+        "[4] Run Simulation\n"
+        "[5] View Results\n"
+        "[6] Exit\n"
+        + "=" * 60 + "\n"
+    )
+
     def _print_menu(self):
-        """Print main menu"""
-        print("\n" + "=" * 60)
-        print("MAIN MENU")
-        print("=" * 60)
-        print("[1] Define New Scenario")
-        print("[2] Load Scenario from File")
-        print("[3] Configure Detection Settings")
-        print("[4] Run Simulation")
-        print("[5] View Results")
-        print("[6] Exit")
-        print("=" * 60)
+        """Print main menu with a single stdout write"""
+        sys.stdout.write(self._MENU)
+        sys.stdout.flush()
     
     def _define_scenario(self):
         """Interactive scenario definition"""
@@ -204,21 +211,32 @@ class CLI:
             return
         
         state = self.controller.get_current_state()
-        
-        print("\n" + "=" * 60)
-        print("CURRENT SYSTEM STATE")
-        print("=" * 60)
-        print(f"Iteration: {state['iteration']}")
-        print(f"System State: {state['system_state']}")
-        print(f"Running: {state['running']}")
-        
-        print("\nProcesses:")
+
+        # Build the whole report and emit it with one write
+        lines = [
+            "",
+            "=" * 60,
+            "CURRENT SYSTEM STATE",
+            "=" * 60,
+            f"Iteration: {state['iteration']}",
+            f"System State: {state['system_state']}",
+            f"Running: {state['running']}",
+            "",
+            "Processes:",
+        ]
         for pid, proc in state['processes'].items():
-            print(f"  {pid}: {proc['state']} (priority={proc['priority']})")
-        
-        print("\nResources:")
+            lines.append(f"  {pid}: {proc['state']} (priority={proc['priority']})")
+
+        lines.append("")
+        lines.append("Resources:")
         for rid, res in state['resources'].items():
-            print(f"  {rid}: {res['state']} (available={res['available_instances']}/{res['total_instances']})")
+            lines.append(
+                f"  {rid}: {res['state']} "
+                f"(available={res['available_instances']}/{res['total_instances']})"
+            )
+
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
     
     def _print_report(self, report: dict):
         """Print simulation report"""
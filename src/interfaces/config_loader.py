@@ -1,14 +1,44 @@
 """
 Configuration file loader for JSON/YAML scenarios
 """
+import copy
+import functools
 import json
 import yaml
 import logging
 from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json still works
+    orjson = None
+
 from ..simulation.controller import SimulationController, SimulationConfig
 
 logger = logging.getLogger(__name__)
 
+# libyaml's C loader parses roughly an order of magnitude faster than
+# the pure-Python SafeLoader; fall back when PyYAML was built without it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_scenario_file(path_str: str, mtime_ns: int) -> dict:
+    """
+    Parse a scenario file, cached by (path, mtime)
+
+    Repeated loads of the same unchanged file (CLI re-runs, tests) skip
+    the parse entirely; an edited file gets a new mtime and re-parses.
+    """
+    filepath = Path(path_str)
+    with open(filepath, 'r') as f:
+        if filepath.suffix == '.json':
+            return json.load(f)
+        elif filepath.suffix in ['.yaml', '.yml']:
+            return yaml.load(f, Loader=_YAML_LOADER)
+        else:
+            raise ValueError(f"Unsupported file format: {filepath.suffix}")
+
 
 def load_scenario(filename: str, config: SimulationConfig = None) -> SimulationController:
     """
@@ -26,15 +56,12 @@ def load_scenario(filename: str, config: SimulationConfig = None) -> SimulationC
     if not filepath.exists():
         raise FileNotFoundError(f"Configuration file not found: {filename}")
     
-    # Load file based on extension
-    with open(filepath, 'r') as f:
-        if filepath.suffix == '.json':
-            data = json.load(f)
-        elif filepath.suffix in ['.yaml', '.yml']:
-            data = yaml.safe_load(f)
-        else:
-            raise ValueError(f"Unsupported file format: {filepath.suffix}")
-    
+    # Load file based on extension; the parse is cached by mtime and
+    # deep-copied so callers can't mutate the cached dict
+    data = copy.deepcopy(
+        _parse_scenario_file(str(filepath), filepath.stat().st_mtime_ns)
+    )
+
     logger.info(f"Loaded scenario: {data.get('scenario_name', 'Unnamed')}")
     
     # Update config from file
@@ -69,24 +96,28 @@ def load_scenario(filename: str, config: SimulationConfig = None) -> SimulationC
             resource_type=res_data.get('type', 'Generic')
         )
     
-    # Initial allocations
-    for alloc in data.get('initial_allocations', []):
-        try:
-            controller.request_resource(alloc['process'], alloc['resource'])
-        except Exception as e:
-            logger.warning(f"Failed to allocate {alloc['resource']} to {alloc['process']}: {e}")
-    
-    # Resource requests
-    for req in data.get('resource_requests', []):
-        try:
-            controller.request_resource(req['process'], req['resource'])
-        except Exception as e:
-            logger.warning(f"Failed to request {req['resource']} for {req['process']}: {e}")
-    
+    # Initial allocations and resource requests, applied as one batch so
+    # immediate-strategy detection runs once after setup instead of once
+    # per blocked request
+    controller.batch_request(
+        [(a['process'], a['resource']) for a in data.get('initial_allocations', [])]
+        + [(r['process'], r['resource']) for r in data.get('resource_requests', [])]
+    )
+
     logger.info(f"Scenario loaded: {len(controller.processes)} processes, {len(controller.resources)} resources")
     return controller
 
 
+def _write_scenario(path: Path, scenario: dict):
+    """Write a scenario as indented JSON, via orjson's C encoder when present"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(scenario, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(scenario, f, indent=2)
+
+
 def create_example_scenarios():
     """Create example scenario files"""
     scenarios_dir = Path('scenarios')
@@ -116,8 +147,7 @@ def create_example_scenarios():
         ]
     }
     
-    with open(scenarios_dir / 'simple_deadlock.json', 'w') as f:
-        json.dump(simple_deadlock, f, indent=2)
+    _write_scenario(scenarios_dir / 'simple_deadlock.json', simple_deadlock)
     
     # Complex deadlock scenario
     complex_deadlock = {
@@ -147,8 +177,7 @@ def create_example_scenarios():
         ]
     }
     
-    with open(scenarios_dir / 'complex_deadlock.json', 'w') as f:
-        json.dump(complex_deadlock, f, indent=2)
+    _write_scenario(scenarios_dir / 'complex_deadlock.json', complex_deadlock)
     
     # No deadlock scenario
     no_deadlock = {
@@ -172,8 +201,7 @@ def create_example_scenarios():
         ]
     }
     
-    with open(scenarios_dir / 'no_deadlock.json', 'w') as f:
-        json.dump(no_deadlock, f, indent=2)
+    _write_scenario(scenarios_dir / 'no_deadlock.json', no_deadlock)
     
     logger.info("Example scenarios created in 'scenarios/' directory")
 
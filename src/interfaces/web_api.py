@@ -2,18 +2,30 @@
 Flask-based REST API for web GUI
 """
 from flask import Flask, request, jsonify, render_template, send_from_directory
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+import gzip
+import itertools
 import logging
 import os
+import threading
 from pathlib import Path
 from typing import Dict
 
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json still works
+    orjson = None
+
+try:
+    from waitress import serve as waitress_serve
+except ImportError:  # optional production server; dev server still works
+    waitress_serve = None
+
 from ..simulation.controller import SimulationController, SimulationConfig
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Logging configuration belongs to the entry point (main.py); a library
+# module only gets its logger
 logger = logging.getLogger(__name__)
 
 # Get the correct paths
@@ -21,15 +33,77 @@ BASE_DIR = Path(__file__).resolve().parent.parent.parent
 TEMPLATE_DIR = BASE_DIR / 'web' / 'templates'
 STATIC_DIR = BASE_DIR / 'web' / 'static'
 
+class _OrjsonProvider(JSONProvider):
+    """Back Flask's jsonify/request.get_json with orjson's C codec"""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=list).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 # Initialize Flask app with correct paths
-app = Flask(__name__, 
+app = Flask(__name__,
             template_folder=str(TEMPLATE_DIR),
             static_folder=str(STATIC_DIR))
 CORS(app)
 
-# Global storage
+# With the provider swapped, even code paths that still go through
+# jsonify (error handlers, third-party extensions) encode via orjson
+if orjson is not None:
+    app.json = _OrjsonProvider(app)
+
+# Templates never change at runtime; skip the per-request mtime check
+# Werkzeug does when auto-reload is on
+app.config['TEMPLATES_AUTO_RELOAD'] = False
+app.jinja_env.auto_reload = False
+
+# Global storage. With waitress serving from a thread pool, each
+# simulation gets its own lock so concurrent requests only contend when
+# they target the same sim; a single global lock would serialize all
+# endpoints behind any long-running /run
 active_simulations: Dict[str, SimulationController] = {}
-simulation_counter = 0
+_sim_locks: Dict[str, threading.Lock] = {}
+_registry_lock = threading.Lock()
+_sim_counter = itertools.count(1)
+# Per-sim cache of the encoded /state body, keyed by the identity of the
+# controller's memoized snapshot dict
+_state_bytes: Dict[str, tuple] = {}
+
+
+def _sim_lock(sim_id: str) -> threading.Lock:
+    """Get (lazily creating) the per-simulation lock"""
+    with _registry_lock:
+        lock = _sim_locks.get(sim_id)
+        if lock is None:
+            lock = _sim_locks[sim_id] = threading.Lock()
+        return lock
+
+
+def _get_controller(sim_id: str) -> SimulationController:
+    """
+    Fetch a live controller with a single dict lookup (None if unknown)
+
+    Controllers are never removed from the registry, so the fetch is
+    safe outside the per-sim lock; only controller access needs it.
+    """
+    return active_simulations.get(sim_id)
+
+
+def json_response(payload, status: int = 200):
+    """
+    Build a JSON response, using orjson's C encoder when available
+
+    orjson serializes the nested system-state dicts several times faster
+    than the stdlib encoder; sets fall back to lists via default=list.
+    """
+    if orjson is not None:
+        return app.response_class(
+            orjson.dumps(payload, default=list),
+            mimetype='application/json'
+        ), status
+    return jsonify(payload), status
 
 
 @app.route('/')
@@ -45,7 +119,7 @@ def index():
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return jsonify({
+    return json_response({
         'status': 'healthy',
         'active_simulations': len(active_simulations),
         'template_dir': str(TEMPLATE_DIR),
@@ -56,8 +130,6 @@ def health_check():
 @app.route('/api/simulation/create', methods=['POST'])
 def create_simulation():
     """Create a new simulation instance"""
-    global simulation_counter
-    
     try:
         data = request.get_json() or {}
         
@@ -69,13 +141,12 @@ def create_simulation():
         
         controller = SimulationController(config)
         
-        simulation_counter += 1
-        sim_id = f"sim_{simulation_counter}"
+        sim_id = f"sim_{next(_sim_counter)}"
         active_simulations[sim_id] = controller
         
         logger.info(f"Created simulation {sim_id}")
         
-        return jsonify({
+        return json_response({
             'simulation_id': sim_id,
             'status': 'created',
             'config': {
@@ -83,170 +154,331 @@ def create_simulation():
                 'detection_interval': config.detection_interval,
                 'recovery_strategy': config.recovery_strategy
             }
-        }), 201
+        }, 201)
         
     except Exception as e:
         logger.error(f"Error creating simulation: {e}")
-        return jsonify({'error': str(e)}), 400
+        return json_response({'error': str(e)}, 400)
 
 
 @app.route('/api/simulation/<sim_id>/process', methods=['POST'])
 def add_process(sim_id: str):
     """Add a process to simulation"""
-    if sim_id not in active_simulations:
-        return jsonify({'error': 'Simulation not found'}), 404
+    controller = _get_controller(sim_id)
+    if controller is None:
+        return json_response({'error': 'Simulation not found'}, 404)
     
     try:
-        controller = active_simulations[sim_id]
         data = request.get_json()
-        
-        process = controller.add_process(
-            pid=data['pid'],
-            priority=int(data.get('priority', 5)),
-            execution_time=int(data.get('execution_time', 100))
-        )
-        
-        return jsonify({
-            'status': 'success',
-            'process': process.to_dict()
-        }), 201
+        with _sim_lock(sim_id):
+            process = controller.add_process(
+                pid=data['pid'],
+                priority=int(data.get('priority', 5)),
+                execution_time=int(data.get('execution_time', 100))
+            )
+            payload = {
+                'status': 'success',
+                'process': process.to_dict()
+            }
+        return json_response(payload, 201)
         
     except Exception as e:
         logger.error(f"Error adding process: {e}")
-        return jsonify({'error': str(e)}), 400
+        return json_response({'error': str(e)}, 400)
 
 
 @app.route('/api/simulation/<sim_id>/resource', methods=['POST'])
 def add_resource(sim_id: str):
     """Add a resource to simulation"""
-    if sim_id not in active_simulations:
-        return jsonify({'error': 'Simulation not found'}), 404
+    controller = _get_controller(sim_id)
+    if controller is None:
+        return json_response({'error': 'Simulation not found'}, 404)
     
     try:
-        controller = active_simulations[sim_id]
         data = request.get_json()
-        
-        resource = controller.add_resource(
-            rid=data['rid'],
-            instances=int(data.get('instances', 1)),
-            resource_type=data.get('resource_type', 'Generic')
-        )
-        
-        return jsonify({
-            'status': 'success',
-            'resource': resource.to_dict()
-        }), 201
+        with _sim_lock(sim_id):
+            resource = controller.add_resource(
+                rid=data['rid'],
+                instances=int(data.get('instances', 1)),
+                resource_type=data.get('resource_type', 'Generic')
+            )
+            payload = {
+                'status': 'success',
+                'resource': resource.to_dict()
+            }
+        return json_response(payload, 201)
         
     except Exception as e:
         logger.error(f"Error adding resource: {e}")
-        return jsonify({'error': str(e)}), 400
+        return json_response({'error': str(e)}, 400)
+
+
+@app.route('/api/simulation/<sim_id>/processes', methods=['POST'])
+def add_processes(sim_id: str):
+    """Add many processes in one request"""
+    controller = _get_controller(sim_id)
+    if controller is None:
+        return json_response({'error': 'Simulation not found'}, 404)
+
+    try:
+        data = request.get_json()
+        specs = [
+            (
+                proc_data['pid'],
+                int(proc_data.get('priority', 5)),
+                int(proc_data.get('execution_time', 100))
+            )
+            for proc_data in data['processes']
+        ]
+        with _sim_lock(sim_id):
+            added = controller.add_processes(specs)
+            payload = {
+                'status': 'success',
+                'processes': [p.to_dict() for p in added]
+            }
+        logger.info(f"Added {len(added)} processes to {sim_id}")
+        return json_response(payload, 201)
+
+    except Exception as e:
+        logger.error(f"Error adding processes: {e}")
+        return json_response({'error': str(e)}, 400)
+
+
+@app.route('/api/simulation/<sim_id>/resources', methods=['POST'])
+def add_resources(sim_id: str):
+    """Add many resources in one request"""
+    controller = _get_controller(sim_id)
+    if controller is None:
+        return json_response({'error': 'Simulation not found'}, 404)
+
+    try:
+        data = request.get_json()
+        specs = [
+            (
+                res_data['rid'],
+                int(res_data.get('instances', 1)),
+                res_data.get('resource_type', 'Generic')
+            )
+            for res_data in data['resources']
+        ]
+        with _sim_lock(sim_id):
+            added = controller.add_resources(specs)
+            payload = {
+                'status': 'success',
+                'resources': [r.to_dict() for r in added]
+            }
+        logger.info(f"Added {len(added)} resources to {sim_id}")
+        return json_response(payload, 201)
+
+    except Exception as e:
+        logger.error(f"Error adding resources: {e}")
+        return json_response({'error': str(e)}, 400)
+
+
+@app.route('/api/simulation/<sim_id>/requests', methods=['POST'])
+def request_resources(sim_id: str):
+    """Apply many resource requests in one batch"""
+    controller = _get_controller(sim_id)
+    if controller is None:
+        return json_response({'error': 'Simulation not found'}, 404)
+
+    try:
+        data = request.get_json()
+        pairs = [(r['process'], r['resource']) for r in data['requests']]
+        with _sim_lock(sim_id):
+            failures = controller.batch_request(pairs)
+            applied = len(pairs) - len(failures)
+            payload = {
+                'status': 'success' if not failures else (
+                    'partial' if applied else 'error'
+                ),
+                'applied': applied,
+                'failed': [
+                    {'process': pid, 'resource': rid, 'error': reason}
+                    for pid, rid, reason in failures
+                ],
+                'system_state': controller.system_state.state
+            }
+        logger.info(
+            f"Applied {applied}/{len(pairs)} resource requests to {sim_id}"
+        )
+        # Nothing applied at all mirrors the single-request endpoint's 400
+        status = 400 if pairs and not applied else 200
+        return json_response(payload, status)
+
+    except Exception as e:
+        logger.error(f"Error requesting resources: {e}")
+        return json_response({'error': str(e)}, 400)
 
 
 @app.route('/api/simulation/<sim_id>/request', methods=['POST'])
 def request_resource(sim_id: str):
     """Process requests a resource"""
-    if sim_id not in active_simulations:
-        return jsonify({'error': 'Simulation not found'}), 404
+    controller = _get_controller(sim_id)
+    if controller is None:
+        return json_response({'error': 'Simulation not found'}, 404)
     
     try:
-        controller = active_simulations[sim_id]
         data = request.get_json()
-        
         pid = data['process']
         rid = data['resource']
-        
-        process = controller.processes[pid]
-        
-        controller.request_resource(pid, rid)
-        
-        allocation_result = 'allocated' if rid in process.held_resources else 'blocked'
-        
-        return jsonify({
-            'status': 'success',
-            'allocation_result': allocation_result,
-            'process_state': process.state,
-            'system_state': controller.system_state.state
-        }), 200
+
+        with _sim_lock(sim_id):
+            process = controller.processes[pid]
+            controller.request_resource(pid, rid)
+            allocation_result = (
+                'allocated' if rid in process.held_resources else 'blocked'
+            )
+            payload = {
+                'status': 'success',
+                'allocation_result': allocation_result,
+                'process_state': process.state,
+                'system_state': controller.system_state.state
+            }
+        return json_response(payload)
         
     except Exception as e:
         logger.error(f"Error requesting resource: {e}")
-        return jsonify({'error': str(e)}), 400
+        return json_response({'error': str(e)}, 400)
 
 
 @app.route('/api/simulation/<sim_id>/run', methods=['POST'])
 def run_simulation(sim_id: str):
     """Run the simulation"""
-    if sim_id not in active_simulations:
-        return jsonify({'error': 'Simulation not found'}), 404
+    controller = _get_controller(sim_id)
+    if controller is None:
+        return json_response({'error': 'Simulation not found'}, 404)
     
     try:
-        controller = active_simulations[sim_id]
         data = request.get_json() or {}
-        
         steps = data.get('steps', None)
         if steps is not None:
             steps = int(steps)
-        
-        report = controller.run_simulation(steps=steps)
-        
-        return jsonify({
-            'status': 'complete',
-            'report': report
-        }), 200
+
+        with _sim_lock(sim_id):
+            report = controller.run_simulation(steps=steps)
+
+        payload = {'status': 'complete', 'report': report}
+        if orjson is None:
+            return json_response(payload)
+
+        body = orjson.dumps(payload, default=list)
+        # The log-heavy report compresses ~5x; level-1 gzip is close to
+        # memcpy speed so only tiny responses skip it
+        if len(body) > 4096 and 'gzip' in request.accept_encodings:
+            response = app.response_class(
+                gzip.compress(body, compresslevel=1),
+                mimetype='application/json'
+            )
+            response.headers['Content-Encoding'] = 'gzip'
+            return response, 200
+
+        return app.response_class(body, mimetype='application/json'), 200
         
     except Exception as e:
         logger.error(f"Error running simulation: {e}")
-        return jsonify({'error': str(e)}), 400
+        return json_response({'error': str(e)}, 400)
 
 
 @app.route('/api/simulation/<sim_id>/state', methods=['GET'])
 def get_state(sim_id: str):
     """Get current simulation state"""
-    if sim_id not in active_simulations:
-        return jsonify({'error': 'Simulation not found'}), 404
+    controller = _get_controller(sim_id)
+    if controller is None:
+        return json_response({'error': 'Simulation not found'}, 404)
     
     try:
-        controller = active_simulations[sim_id]
-        state = controller.get_current_state()
-        return jsonify(state), 200
-        
+        with _sim_lock(sim_id):
+            state = controller.get_current_state()
+
+        if orjson is None:
+            return json_response(state)
+
+        # The controller memoizes the snapshot (same dict object until a
+        # mutation), so cache the encoded bytes alongside it: an idle
+        # poll costs a dict identity check instead of a full re-encode
+        cached = _state_bytes.get(sim_id)
+        if cached is not None and cached[0] is state:
+            body = cached[1]
+        else:
+            body = orjson.dumps(state, default=list)
+            _state_bytes[sim_id] = (state, body)
+
+        return app.response_class(body, mimetype='application/json'), 200
+
     except Exception as e:
         logger.error(f"Error getting state: {e}")
-        return jsonify({'error': str(e)}), 400
+        return json_response({'error': str(e)}, 400)
+
+
+@app.route('/api/simulation/<sim_id>/log', methods=['GET'])
+def get_log(sim_id: str):
+    """Get log events newer than the `since` sequence number"""
+    controller = _get_controller(sim_id)
+    if controller is None:
+        return json_response({'error': 'Simulation not found'}, 404)
+
+    try:
+        since = int(request.args.get('since', 0))
+        with _sim_lock(sim_id):
+            events = controller.get_log_since(since)
+        return json_response({
+            'events': events,
+            'last_seq': events[-1]['seq'] if events else since
+        })
+
+    except Exception as e:
+        logger.error(f"Error getting log: {e}")
+        return json_response({'error': str(e)}, 400)
 
 
 @app.route('/api/simulation/<sim_id>/reset', methods=['POST'])
 def reset_simulation(sim_id: str):
     """Reset simulation to initial state"""
-    if sim_id not in active_simulations:
-        return jsonify({'error': 'Simulation not found'}), 404
+    controller = _get_controller(sim_id)
+    if controller is None:
+        return json_response({'error': 'Simulation not found'}, 404)
     
     try:
-        controller = active_simulations[sim_id]
-        controller.reset()
-        return jsonify({'status': 'reset'}), 200
+        with _sim_lock(sim_id):
+            controller.reset()
+        return json_response({'status': 'reset'})
         
     except Exception as e:
         logger.error(f"Error resetting simulation: {e}")
-        return jsonify({'error': str(e)}), 400
+        return json_response({'error': str(e)}, 400)
+
+
+@app.after_request
+def _no_store_for_live_data(response):
+    """Stop browsers revalidating live state endpoints against a cache"""
+    if request.path.startswith('/api/'):
+        response.headers['Cache-Control'] = 'no-store'
+    return response
 
 
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors"""
-    return jsonify({'error': 'Not found'}), 404
+    return json_response({'error': 'Not found'}, 404)
 
 
 @app.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors"""
     logger.error(f"Internal error: {error}")
-    return jsonify({'error': 'Internal server error', 'details': str(error)}), 500
+    return json_response({'error': 'Internal server error', 'details': str(error)}, 500)
 
 
 def start_server(host: str = '0.0.0.0', port: int = 5000, debug: bool = False):
-    """Start Flask development server"""
-    logger.info(f"Starting Flask server on {host}:{port}")
+    """
+    Start the web server
+
+    Serves through waitress (multi-threaded WSGI) when available and not
+    debugging, so state polls stay responsive while a simulation runs;
+    Werkzeug's single-threaded dev server would serialize every request.
+    """
+    logger.info(f"Starting web server on {host}:{port}")
     logger.info(f"Template directory: {TEMPLATE_DIR}")
     logger.info(f"Static directory: {STATIC_DIR}")
     
@@ -264,8 +496,11 @@ def start_server(host: str = '0.0.0.0', port: int = 5000, debug: bool = False):
         return
     
     print(f"\nAccess web interface at: http://localhost:{port}\n")
-    
-    app.run(host=host, port=port, debug=debug)
+
+    if waitress_serve is not None and not debug:
+        waitress_serve(app, host=host, port=port, threads=16)
+    else:
+        app.run(host=host, port=port, debug=debug)
 
 
 if __name__ == '__main__':
@@ -8,6 +8,14 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Termination-cost weights (see VictimSelector.select_by_cost), bound
+# once at import instead of rebuilt on every selection call
+_RESOURCE_WEIGHT = 10
+_EXECUTION_WEIGHT = 1
+_PROGRESS_WEIGHT = 5
+_PRIORITY_WEIGHT = 20
+_STARVATION_WEIGHT = 50
+
 
 @dataclass
 class RecoveryResult:
@@ -35,7 +43,9 @@ class VictimSelector:
     """Victim selection strategies"""
     
     @staticmethod
-    def select_by_priority(processes: Dict, deadlocked_pids: Set[str]) -> str:
+    def select_by_priority(
+        processes: Dict, deadlocked_pids: Set[str], now: float = None
+    ) -> str:
         """
         Select victim with lowest priority (highest priority number)
         
@@ -46,95 +56,84 @@ class VictimSelector:
         Returns:
             Process ID of selected victim
         """
-        victim = None
-        lowest_priority = -1
-        
-        for pid in deadlocked_pids:
-            process = processes[pid]
-            if process.priority > lowest_priority:
-                lowest_priority = process.priority
-                victim = pid
-        
-        logger.info(f"Victim selected by priority: {victim} (priority={lowest_priority})")
+        # max() drives the scan from C; the key runs once per candidate
+        victim = max(deadlocked_pids, key=lambda pid: processes[pid].priority)
+
+        logger.info(
+            "Victim selected by priority: %s (priority=%s)",
+            victim, processes[victim].priority
+        )
         return victim
     
     @staticmethod
-    def select_by_cost(processes: Dict, deadlocked_pids: Set[str]) -> str:
+    def select_by_cost(
+        processes: Dict, deadlocked_pids: Set[str], now: float = None
+    ) -> str:
         """
         Select victim with minimum termination cost
         
-        Cost = resources_held * 10 + execution_time * 1 + progress * 5 
+        Cost = resources_held * 10 + execution_time * 1 + progress * 5
                + (10 - priority) * 20 - victim_count * 50
+
+        `now` is an optional clock snapshot so repeated selections in
+        one recovery share a single time.time() call.
         """
-        RESOURCE_WEIGHT = 10
-        EXECUTION_WEIGHT = 1
-        PROGRESS_WEIGHT = 5
-        PRIORITY_WEIGHT = 20
-        STARVATION_WEIGHT = 50
-        
-        victim = None
-        min_cost = float('inf')
-        
-        for pid in deadlocked_pids:
+        if now is None:
+            now = time.time()
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        def termination_cost(pid: str) -> float:
             process = processes[pid]
-            
-            resources_cost = len(process.held_resources) * RESOURCE_WEIGHT
-            execution_cost = process.execution_time * EXECUTION_WEIGHT
-            progress_cost = process.get_elapsed_time() * PROGRESS_WEIGHT
-            priority_cost = (10 - process.priority) * PRIORITY_WEIGHT
-            starvation_penalty = process.victim_count * STARVATION_WEIGHT
-            
+            resources_cost = len(process.held_resources) * _RESOURCE_WEIGHT
+            execution_cost = process.execution_time * _EXECUTION_WEIGHT
+            progress_cost = (now - process.creation_time) * _PROGRESS_WEIGHT
+            priority_cost = (10 - process.priority) * _PRIORITY_WEIGHT
+            starvation_penalty = process.victim_count * _STARVATION_WEIGHT
+
             total_cost = (
-                resources_cost + execution_cost + progress_cost + 
+                resources_cost + execution_cost + progress_cost +
                 priority_cost - starvation_penalty
             )
-            
-            logger.debug(
-                f"Cost for {pid}: resources={resources_cost}, "
-                f"execution={execution_cost}, progress={progress_cost}, "
-                f"priority={priority_cost}, starvation={starvation_penalty}, "
-                f"total={total_cost}"
-            )
-            
-            if total_cost < min_cost:
-                min_cost = total_cost
-                victim = pid
-        
-        logger.info(f"Victim selected by cost: {victim} (cost={min_cost})")
+            if debug:
+                logger.debug(
+                    "Cost for %s: resources=%s, execution=%s, progress=%s, "
+                    "priority=%s, starvation=%s, total=%s",
+                    pid, resources_cost, execution_cost, progress_cost,
+                    priority_cost, starvation_penalty, total_cost
+                )
+            return total_cost
+
+        victim = min(deadlocked_pids, key=termination_cost)
+
+        logger.info("Victim selected by cost: %s", victim)
         return victim
     
     @staticmethod
-    def select_by_time(processes: Dict, deadlocked_pids: Set[str]) -> str:
+    def select_by_time(
+        processes: Dict, deadlocked_pids: Set[str], now: float = None
+    ) -> str:
         """Select victim with least execution time (newest process)"""
-        victim = None
-        min_time = float('inf')
-        
-        for pid in deadlocked_pids:
-            process = processes[pid]
-            elapsed = process.get_elapsed_time()
-            if elapsed < min_time:
-                min_time = elapsed
-                victim = pid
-        
-        logger.info(f"Victim selected by time: {victim} (time={min_time}s)")
+        if now is None:
+            now = time.time()
+        victim = min(
+            deadlocked_pids, key=lambda pid: now - processes[pid].creation_time
+        )
+
+        logger.info("Victim selected by time: %s", victim)
         return victim
     
     @staticmethod
-    def select_by_resources(processes: Dict, deadlocked_pids: Set[str]) -> str:
+    def select_by_resources(
+        processes: Dict, deadlocked_pids: Set[str], now: float = None
+    ) -> str:
         """Select victim holding fewest resources"""
-        victim = None
-        min_resources = float('inf')
-        
-        for pid in deadlocked_pids:
-            process = processes[pid]
-            resource_count = len(process.held_resources)
-            if resource_count < min_resources:
-                min_resources = resource_count
-                victim = pid
-        
+        victim = min(
+            deadlocked_pids, key=lambda pid: len(processes[pid].held_resources)
+        )
+
         logger.info(
-            f"Victim selected by resource count: {victim} "
-            f"(resources={min_resources})"
+            "Victim selected by resource count: %s (resources=%s)",
+            victim, len(processes[victim].held_resources)
         )
         return victim
 
@@ -187,18 +186,21 @@ class RecoveryModule:
         self.recovery_count += 1
         
         victims = []
+        victim_set = set()  # membership shadow for the ordered victim list
         resources_released = set()
         unblocked_processes = set()
         
-        logger.info(f"Starting recovery for deadlock involving: {deadlocked_pids}")
+        logger.info("Starting recovery for deadlock involving: %s", deadlocked_pids)
         
-        # Iteratively select and terminate victims until deadlock is broken
+        # Iteratively select and terminate victims until deadlock is broken;
+        # one clock snapshot serves every selection in this recovery
         remaining_deadlocked = deadlocked_pids.copy()
-        
+
         while remaining_deadlocked:
             # Select victim
-            victim_pid = self.selector(processes, remaining_deadlocked)
+            victim_pid = self.selector(processes, remaining_deadlocked, now=start_time)
             victims.append(victim_pid)
+            victim_set.add(victim_pid)
             remaining_deadlocked.remove(victim_pid)
             
             # Terminate victim and release resources
@@ -208,13 +210,13 @@ class RecoveryModule:
             resources_released.update(victim_resources)
             
             # Check if deadlock is broken
-            if self._would_break_cycle(victim_pid, remaining_deadlocked, processes, resources):
+            if self._would_break_cycle(len(remaining_deadlocked), len(processes)):
                 logger.info(f"Deadlock broken after terminating {len(victims)} victim(s)")
                 break
         
-        # Unblock remaining processes
+        # Unblock remaining processes (set lookup, not a list scan)
         for pid in deadlocked_pids:
-            if pid not in victims:
+            if pid not in victim_set:
                 process = processes[pid]
                 # Try to allocate requested resources
                 if self._try_allocate_resources(process, resources):
@@ -262,22 +264,22 @@ class RecoveryModule:
             if rid in resources:
                 resource = resources[rid]
                 resource.release(victim_pid)
-                logger.debug(f"Released resource {rid} from victim {victim_pid}")
+                logger.debug("Released resource %s from victim %s", rid, victim_pid)
         
-        logger.info(f"Terminated victim {victim_pid}, released {len(released_resources)} resources")
+        logger.info(
+            "Terminated victim %s, released %s resources",
+            victim_pid, len(released_resources)
+        )
         return released_resources
     
-    def _would_break_cycle(
-        self, 
-        victim_pid: str, 
-        remaining: Set[str], 
-        processes: Dict, 
-        resources: Dict
-    ) -> bool:
-        """Check if removing victim would break the deadlock cycle"""
+    @staticmethod
+    def _would_break_cycle(remaining_count: int, total_processes: int) -> bool:
+        """Check if terminating the last victim would break the deadlock cycle"""
         # Simplified check: assume single victim breaks cycle for now
-        # In complex scenarios, might need to rebuild WFG and check
-        return len(remaining) == 0 or len(remaining) < len(processes) / 2
+        # In complex scenarios, might need to rebuild WFG and check.
+        # Pure function of two counts, so callers pass ints instead of
+        # the full process/resource maps
+        return remaining_count == 0 or remaining_count < total_processes / 2
     
     def _try_allocate_resources(self, process, resources: Dict) -> bool:
         """Try to allocate requested resources to process"""
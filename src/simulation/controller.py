@@ -7,14 +7,20 @@ import time
 import logging
 from enum import Enum
 
+from collections import Counter, deque
+
 from ..core.process import Process
 from ..core.resource import Resource
 from ..core.system_state import SystemState
 from ..detection.detector import DeadlockDetector
+from ..detection.wfg import WaitForGraph
 from ..recovery.recovery import RecoveryModule
 
 logger = logging.getLogger(__name__)
 
+# Process states that justify wait-for edges (mirrors detection.wfg)
+_WAITING_STATES = frozenset({'Blocked', 'Deadlocked'})
+
 
 class DetectionStrategy(Enum):
     """Detection triggering strategies"""
@@ -31,6 +37,7 @@ class SimulationConfig:
     recovery_strategy: str = "cost"
     cpu_threshold: float = 20.0  # percent
     max_iterations: int = 100
+    log_capacity: int = 1000  # ring-buffer size for the event log
 
 
 @dataclass
@@ -76,12 +83,42 @@ class SimulationController:
         self.detector = DeadlockDetector()
         self.recovery = RecoveryModule(strategy=self.config.recovery_strategy)
         
+        # Live wait-for graph, maintained incrementally on each
+        # allocation/request delta instead of rebuilt per detection tick
+        self.wfg = WaitForGraph()
+        self._wfg_edge_refs = Counter()
+        self._wfg_resource_edges: Dict[str, set] = {}
+
+        # Set while batch_request applies many allocations, so the
+        # immediate strategy runs detection once at the end instead of
+        # once per blocked request
+        self._suppress_detection = False
+
         # Simulation state
         self.metrics = SimulationMetrics()
         self.iteration = 0
         self.last_detection_time = 0.0
-        self.simulation_log = []
+        # Bounded ring buffer: memory and report size stay O(capacity)
+        # instead of growing with iteration count; seq numbers let
+        # clients fetch only events they have not seen yet
+        self.simulation_log = deque(maxlen=self.config.log_capacity)
+        self._log_seq = 0
         self.running = False
+
+        # State census maintained at the transition points: per-state
+        # process counts plus free/allocated instance totals, so the
+        # CPU-triggered strategy check and metric snapshots are O(1)
+        # instead of scans over all processes and resources
+        self._state_counts = Counter()
+        self._free_instances = 0
+        self._allocated_instances = 0
+
+        # Snapshot memoization: get_current_state reuses the last built
+        # dict until a mutation bumps the version (process/resource
+        # to_dicts are cached on the objects themselves)
+        self._state_version = 0
+        self._snapshot_key = None
+        self._snapshot = None
     
     def add_process(self, pid: str, priority: int = 5, execution_time: int = 100):
         """Add a process to the system"""
@@ -90,7 +127,10 @@ class SimulationController:
         
         process = Process(pid=pid, priority=priority, execution_time=execution_time)
         self.processes[pid] = process
-        logger.info(f"Added process {pid}")
+        self.wfg.add_node(pid)
+        self._state_counts[process.state] += 1
+        self._state_version += 1
+        logger.info("Added process %s", pid)
         return process
     
     def add_resource(self, rid: str, instances: int = 1, resource_type: str = "Generic"):
@@ -100,9 +140,30 @@ class SimulationController:
         
         resource = Resource(rid=rid, total_instances=instances, resource_type=resource_type)
         self.resources[rid] = resource
-        logger.info(f"Added resource {rid}")
+        self._free_instances += instances
+        self._state_version += 1
+        logger.info("Added resource %s", rid)
         return resource
     
+    def add_processes(self, specs) -> list:
+        """
+        Add many processes in one call
+
+        Each spec is a (pid,), (pid, priority) or (pid, priority,
+        execution_time) tuple, applied in order. Large scenarios pay
+        one Python call instead of one per process.
+        """
+        return [self.add_process(*spec) for spec in specs]
+
+    def add_resources(self, specs) -> list:
+        """
+        Add many resources in one call
+
+        Each spec is a (rid,), (rid, instances) or (rid, instances,
+        resource_type) tuple, applied in order.
+        """
+        return [self.add_resource(*spec) for spec in specs]
+
     def request_resource(self, pid: str, rid: str):
         """Process requests a resource"""
         if pid not in self.processes:
@@ -112,34 +173,70 @@ class SimulationController:
         
         process = self.processes[pid]
         resource = self.resources[rid]
-        
+        self._state_version += 1
+
         # Process FSA: transition to requesting
         if process.state == 'Ready':
-            process.transition('start')
-        
+            self._transition(process, 'start')
+
         process.request_resource(rid)
-        
+
         # Try to allocate
         if resource.is_available():
             # Allocation successful
             resource.allocate(pid)
             process.allocate_resource(rid)
-            process.transition('allocate')
-            
+            self._transition(process, 'allocate')
+            self._free_instances -= 1
+            self._allocated_instances += 1
+
             self._log_event(f"Process {pid} allocated resource {rid}")
-            logger.info(f"Allocated {rid} to {pid}")
+            logger.info("Allocated %s to %s", rid, pid)
         else:
             # Block process
-            process.transition('deny')
+            self._transition(process, 'deny')
             resource.add_to_wait_queue(pid)
             
             self._log_event(f"Process {pid} blocked waiting for {rid}")
-            logger.info(f"Process {pid} blocked on {rid}")
-            
+            logger.info("Process %s blocked on %s", pid, rid)
+
+            self._sync_wfg_for_resource(rid)
+
             # Trigger immediate detection if configured
-            if self.config.detection_strategy == DetectionStrategy.IMMEDIATE.value:
+            if (self.config.detection_strategy == DetectionStrategy.IMMEDIATE.value
+                    and not self._suppress_detection):
                 self._run_detection()
     
+    def batch_request(self, pairs) -> list:
+        """
+        Apply many (pid, rid) resource requests as one batch
+
+        Defers the immediate-strategy detection trigger until every pair
+        has been applied, so loading a scenario with N allocations costs
+        one detection pass instead of up to N. Individual failures are
+        logged and skipped, matching scenario-loading semantics.
+
+        Returns:
+            List of (pid, rid, reason) tuples for the pairs that failed;
+            empty if every request was applied.
+        """
+        failures = []
+        self._suppress_detection = True
+        try:
+            for pid, rid in pairs:
+                try:
+                    self.request_resource(pid, rid)
+                except Exception as e:
+                    logger.warning(f"Failed to request {rid} for {pid}: {e}")
+                    failures.append((pid, rid, str(e)))
+        finally:
+            self._suppress_detection = False
+
+        if self.config.detection_strategy == DetectionStrategy.IMMEDIATE.value:
+            self._run_detection()
+
+        return failures
+
     def release_resource(self, pid: str, rid: str):
         """Process releases a resource"""
         if pid not in self.processes:
@@ -149,12 +246,15 @@ class SimulationController:
         
         process = self.processes[pid]
         resource = self.resources[rid]
-        
+        self._state_version += 1
+
         if resource.release(pid):
             process.release_resource(rid)
+            self._free_instances += 1
+            self._allocated_instances -= 1
             self._log_event(f"Process {pid} released resource {rid}")
-            logger.info(f"Process {pid} released {rid}")
-            
+            logger.info("Process %s released %s", pid, rid)
+
             # Try to unblock waiting processes
             if resource.wait_queue:
                 waiting_pid = resource.wait_queue[0]
@@ -162,10 +262,14 @@ class SimulationController:
                     waiting_process = self.processes[waiting_pid]
                     resource.allocate(waiting_pid)
                     waiting_process.allocate_resource(rid)
-                    waiting_process.transition('allocate')
+                    self._transition(waiting_process, 'allocate')
+                    self._free_instances -= 1
+                    self._allocated_instances += 1
                     resource.remove_from_wait_queue(waiting_pid)
                     
                     self._log_event(f"Unblocked process {waiting_pid}, allocated {rid}")
+
+            self._sync_wfg_for_resource(rid)
     
     def run_simulation(self, steps: int = None):
         """
@@ -177,33 +281,49 @@ class SimulationController:
         self.running = True
         self.iteration = 0
         max_steps = steps or self.config.max_iterations
-        
+
+        # Logical clock: each iteration advances simulated time by a
+        # fixed step instead of sleeping, so periodic detection still
+        # fires once per detection_interval of simulated time but the
+        # run completes as fast as the CPU allows. The periodic schedule
+        # reduces to integer tick counting (10 ticks per interval),
+        # avoiding per-iteration float clock arithmetic
+        logical_time = time.time()
+        logical_step = self.config.detection_interval / 10
+        periodic = (
+            self.config.detection_strategy == DetectionStrategy.PERIODIC.value
+        )
+        ticks_per_detection = 10
+        ticks_since_detection = ticks_per_detection  # fire on the first tick
+
         logger.info(f"Starting simulation with {len(self.processes)} processes, "
                    f"{len(self.resources)} resources")
         self._log_event("=== SIMULATION STARTED ===")
-        
+
         while self.running and self.iteration < max_steps:
             self.iteration += 1
-            current_time = time.time()
-            
+
             # Check if detection should run
-            if self._should_run_detection(current_time):
-                self._run_detection()
-            
+            if periodic:
+                if ticks_since_detection >= ticks_per_detection:
+                    self._run_detection(logical_time)
+                    ticks_since_detection = 0
+            elif self._should_run_detection(logical_time):
+                self._run_detection(logical_time)
+
             # Simulate process execution (simplified)
             # In a real system, processes would actually execute here
-            
-            # Small delay for periodic detection
-            if self.config.detection_strategy == DetectionStrategy.PERIODIC.value:
-                time.sleep(0.1)  # 100ms
-            
+
             # Check termination condition
             if self._all_processes_terminated():
                 self.running = False
                 logger.info("All processes terminated - simulation complete")
                 self._log_event("=== SIMULATION COMPLETE ===")
                 break
-        
+
+            logical_time += logical_step
+            ticks_since_detection += 1
+
         return self._get_final_report()
     
     def _should_run_detection(self, current_time: float) -> bool:
@@ -219,19 +339,19 @@ class SimulationController:
         
         elif strategy == DetectionStrategy.CPU_TRIGGERED.value:
             # Simplified: check if any processes are blocked
-            blocked_count = sum(
-                1 for p in self.processes.values() 
-                if p.state in ['Blocked', 'Deadlocked']
-            )
-            return blocked_count > 0
+            return self._blocked_count > 0
         
         return False
     
-    def _run_detection(self):
+    def _run_detection(self, current_time: float = None):
         """Run deadlock detection"""
-        self.last_detection_time = time.time()
+        # current_time carries the logical clock from run_simulation;
+        # out-of-loop triggers (immediate strategy) use wall time
+        self.last_detection_time = (
+            current_time if current_time is not None else time.time()
+        )
         
-        result = self.detector.detect(self.processes, self.resources)
+        result = self.detector.detect(self.processes, self.resources, wfg=self.wfg)
         self.metrics.total_detections += 1
         self.metrics.total_detection_time += result.detection_latency / 1000.0  # Convert to seconds
         
@@ -241,6 +361,7 @@ class SimulationController:
         
         if result.deadlock_detected:
             self.metrics.deadlocks_found += 1
+            self._state_version += 1
             
             # Update system FSA
             self.system_state.transition('cycle_detected')
@@ -250,9 +371,9 @@ class SimulationController:
                 if pid in self.processes:
                     process = self.processes[pid]
                     if process.state != 'Deadlocked':
-                        process.transition('detect_cycle')
+                        self._transition(process, 'detect_cycle')
             
-            logger.warning(f"DEADLOCK DETECTED: {result.deadlocked_processes}")
+            logger.warning("DEADLOCK DETECTED: %s", result.deadlocked_processes)
             self._log_event(f"Deadlocked processes: {result.deadlocked_processes}")
             
             # Initiate recovery
@@ -282,9 +403,105 @@ class SimulationController:
         
         # Update system FSA
         self.system_state.transition('recovery_complete')
-        
+
+        # Recovery mutated allocations directly, so resync derived state
+        self._rebuild_wfg()
+        self.detector.invalidate_cache()
+        self._recount_census()
+
         logger.info(f"Recovery complete: {recovery_result.to_dict()}")
     
+    @property
+    def _blocked_count(self) -> int:
+        """Count of Blocked/Deadlocked processes, from the live census"""
+        return self._state_counts['Blocked'] + self._state_counts['Deadlocked']
+
+    def _transition(self, process, input_symbol: str):
+        """Run a process FSA transition, keeping the state census and
+        the live WFG current"""
+        old_state = process.state
+        process.transition(input_symbol)
+        new_state = process.state
+        if new_state == old_state:
+            return
+        self._state_counts[old_state] -= 1
+        self._state_counts[new_state] += 1
+
+        # Crossing the waiting-set boundary changes which wait-for
+        # edges this process justifies: a Blocked process granted some
+        # other resource stops waiting without leaving the old wait
+        # queues, and a re-blocked process must regain edges for every
+        # request still pending, not just the one that was denied
+        if (old_state in _WAITING_STATES) != (new_state in _WAITING_STATES):
+            for rid in process.requested_resources:
+                if rid in self.resources:
+                    self._sync_wfg_for_resource(rid)
+
+    def _recount_census(self):
+        """Recount the state census from scratch (consistency fallback)
+
+        Used after recovery, which transitions processes and moves
+        resource instances without going through the controller.
+        """
+        counts = Counter()
+        for process in self.processes.values():
+            counts[process.state] += 1
+        self._state_counts = counts
+
+        free = allocated = 0
+        for resource in self.resources.values():
+            free += resource.available_instances
+            allocated += resource.total_instances - resource.available_instances
+        self._free_instances = free
+        self._allocated_instances = allocated
+
+    def _sync_wfg_for_resource(self, rid: str):
+        """
+        Reconcile the live WFG with the edges attributable to one resource
+
+        Recomputes waiter->holder edges for rid and applies only the
+        delta; edges justified by several resources are reference-counted
+        so removing one justification does not drop a still-valid edge.
+        """
+        resource = self.resources[rid]
+
+        new_edges = set()
+        for waiter in resource.wait_queue:
+            process = self.processes.get(waiter)
+            if process is None or process.state not in _WAITING_STATES:
+                continue
+            for holder in resource.allocated_to:
+                if holder != waiter and holder in self.processes:
+                    new_edges.add((waiter, holder))
+
+        old_edges = self._wfg_resource_edges.get(rid, set())
+
+        for edge in old_edges - new_edges:
+            self._wfg_edge_refs[edge] -= 1
+            if self._wfg_edge_refs[edge] <= 0:
+                del self._wfg_edge_refs[edge]
+                self.wfg.remove_edge(*edge)
+
+        for edge in new_edges - old_edges:
+            self._wfg_edge_refs[edge] += 1
+            if self._wfg_edge_refs[edge] == 1:
+                self.wfg.add_edge(*edge)
+
+        self._wfg_resource_edges[rid] = new_edges
+
+    def _rebuild_wfg(self):
+        """Rebuild the live WFG from scratch (consistency fallback)"""
+        self.wfg = WaitForGraph()
+        self._wfg_edge_refs = Counter()
+        self._wfg_resource_edges = {}
+
+        for pid, process in self.processes.items():
+            if process.state != 'Terminated':
+                self.wfg.add_node(pid)
+
+        for rid in self.resources:
+            self._sync_wfg_for_resource(rid)
+
     def _all_processes_terminated(self) -> bool:
         """Check if all processes are terminated"""
         return all(
@@ -294,13 +511,26 @@ class SimulationController:
     
     def _log_event(self, message: str):
         """Log a simulation event"""
+        self._log_seq += 1
         event = {
+            'seq': self._log_seq,
             'iteration': self.iteration,
             'timestamp': time.time(),
             'message': message,
             'system_state': self.system_state.state
         }
         self.simulation_log.append(event)
+
+    def get_log_since(self, since: int = 0) -> list:
+        """
+        Get log events with sequence numbers greater than `since`
+
+        Lets pollers stream the event log incrementally: each response
+        is O(new events) instead of re-sending the whole history.
+        """
+        if not self.simulation_log or self.simulation_log[-1]['seq'] <= since:
+            return []
+        return [event for event in self.simulation_log if event['seq'] > since]
     
     def _get_final_report(self) -> dict:
         """Generate final simulation report"""
@@ -320,26 +550,60 @@ class SimulationController:
                 rid: r.to_dict() 
                 for rid, r in self.resources.items()
             },
-            'log': self.simulation_log
+            'log': list(self.simulation_log)
         }
     
     def get_current_state(self) -> dict:
-        """Get current system state snapshot"""
-        return {
+        """Get current system state snapshot
+
+        The snapshot deliberately omits the processes' elapsed_time:
+        every other field only changes on a mutation, so leaving the
+        one per-call value out keeps the memoized dict (and any encoded
+        form cached downstream) valid between mutations instead of
+        silently serving a frozen clock. The final report still carries
+        live elapsed_time via Process.to_dict.
+        """
+        # Repeated polls between mutations reuse the same snapshot dict
+        key = (
+            self._state_version, self.iteration,
+            self.system_state.state, self.running
+        )
+        if key == self._snapshot_key:
+            return self._snapshot
+
+        processes = {}
+        for pid, process in self.processes.items():
+            entry = dict(process.to_dict())
+            del entry['elapsed_time']
+            processes[pid] = entry
+
+        self._snapshot = {
             'iteration': self.iteration,
             'system_state': self.system_state.state,
-            'processes': {pid: p.to_dict() for pid, p in self.processes.items()},
+            'processes': processes,
             'resources': {rid: r.to_dict() for rid, r in self.resources.items()},
             'running': self.running
         }
+        self._snapshot_key = key
+        return self._snapshot
     
     def reset(self):
         """Reset simulation to initial state"""
         self.processes.clear()
         self.resources.clear()
+        self.wfg = WaitForGraph()
+        self._wfg_edge_refs = Counter()
+        self._wfg_resource_edges = {}
         self.system_state.reset()
         self.metrics = SimulationMetrics()
         self.iteration = 0
-        self.simulation_log = []
+        self.simulation_log = deque(maxlen=self.config.log_capacity)
+        self._log_seq = 0
+        self._state_counts = Counter()
+        self._free_instances = 0
+        self._allocated_instances = 0
         self.running = False
+        self._state_version += 1
+        self._snapshot_key = None
+        self._snapshot = None
         logger.info("Simulation reset")
\ No newline at end of file
@@ -1,15 +1,41 @@
 """
 Performance metrics tracking and analysis
 """
+from collections import deque
 from dataclasses import dataclass, field
-from typing import List, Dict
+from typing import List, Dict, Optional
+import array
 import time
 
+# Rolling-window size for the per-event timing buffers; keeps memory
+# bounded no matter how long the simulation runs
+TIMING_WINDOW = 1024
 
-@dataclass
+# System-state names interned as small integer codes so snapshots can
+# store a one-byte code per row instead of a string reference
+_STATE_NAMES: List[str] = []
+_STATE_CODES: Dict[str, int] = {}
+
+
+def _state_code(state: str) -> int:
+    """Map a system-state name to its (stable) integer column code"""
+    code = _STATE_CODES.get(state)
+    if code is None:
+        code = len(_STATE_NAMES)
+        _STATE_NAMES.append(state)
+        _STATE_CODES[state] = code
+    return code
+
+
+@dataclass(slots=True, frozen=True)
 class MetricSnapshot:
-    """Single metric snapshot at a point in time"""
-    timestamp: float
+    """Single metric snapshot at a point in time
+
+    `timestamp_ns` is an integer time.monotonic_ns() reading: one vDSO
+    call with no float rounding, and it packs as an int64 column in
+    SnapshotStore. Divide by 1e9 only when exporting seconds.
+    """
+    timestamp_ns: int
     iteration: int
     system_state: str
     active_processes: int
@@ -19,79 +45,171 @@ class MetricSnapshot:
     allocated_resources: int
 
 
+class SnapshotStore:
+    """
+    Column-oriented storage for metric snapshots
+
+    Keeps each MetricSnapshot field in a contiguous array.array column
+    (struct-of-arrays) instead of one Python object per snapshot: eight
+    unboxed machine values per row rather than a dict-backed instance,
+    which cuts memory several-fold for long simulations and keeps
+    column scans cache-friendly. Rows are materialized back into
+    MetricSnapshot objects only on access.
+    """
+    __slots__ = ('timestamps', 'iterations', 'states', 'active',
+                 'blocked', 'deadlocked', 'free', 'allocated')
+
+    def __init__(self):
+        self.timestamps = array.array('q')
+        self.iterations = array.array('l')
+        self.states = array.array('B')
+        self.active = array.array('l')
+        self.blocked = array.array('l')
+        self.deadlocked = array.array('l')
+        self.free = array.array('l')
+        self.allocated = array.array('l')
+
+    def append(self, snapshot: MetricSnapshot):
+        """Append one snapshot as a row across the columns"""
+        self.timestamps.append(snapshot.timestamp_ns)
+        self.iterations.append(snapshot.iteration)
+        self.states.append(_state_code(snapshot.system_state))
+        self.active.append(snapshot.active_processes)
+        self.blocked.append(snapshot.blocked_processes)
+        self.deadlocked.append(snapshot.deadlocked_processes)
+        self.free.append(snapshot.free_resources)
+        self.allocated.append(snapshot.allocated_resources)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __getitem__(self, index: int) -> MetricSnapshot:
+        return MetricSnapshot(
+            timestamp_ns=self.timestamps[index],
+            iteration=self.iterations[index],
+            system_state=_STATE_NAMES[self.states[index]],
+            active_processes=self.active[index],
+            blocked_processes=self.blocked[index],
+            deadlocked_processes=self.deadlocked[index],
+            free_resources=self.free[index],
+            allocated_resources=self.allocated[index]
+        )
+
+    def __iter__(self):
+        for index in range(len(self.timestamps)):
+            yield self[index]
+
+
 @dataclass
 class PerformanceMetrics:
     """Comprehensive performance metrics"""
     
-    # Detection metrics
+    # Detection metrics. The timing windows and the snapshot store are
+    # allocated lazily on first use, so constructing a metrics object
+    # that never records anything costs no buffer allocations
     total_detections: int = 0
     deadlocks_found: int = 0
     false_positives: int = 0
-    detection_times: List[float] = field(default_factory=list)
-    
+    detection_times: Optional[deque] = None
+
     # Recovery metrics
     total_recoveries: int = 0
-    recovery_times: List[float] = field(default_factory=list)
+    recovery_times: Optional[deque] = None
     processes_terminated: int = 0
-    
+
     # System metrics
     total_iterations: int = 0
     simulation_duration: float = 0.0
-    snapshots: List[MetricSnapshot] = field(default_factory=list)
-    
+    snapshots: Optional[SnapshotStore] = None
+
+    # Running sums maintained at record time, so averages and overhead
+    # are O(1) divisions instead of re-summing the timing buffers. The
+    # window sums track the bounded deques (evicted values subtracted);
+    # the lifetime total backs the overall overhead figure
+    _detection_window_sum: float = field(default=0.0, init=False, repr=False)
+    _recovery_window_sum: float = field(default=0.0, init=False, repr=False)
+    _detection_time_total: float = field(default=0.0, init=False, repr=False)
+
+    # to_dict memoization: a dashboard polling between events reuses
+    # the same dict until one of the key scalars changes
+    _dict_key: tuple = field(default=None, init=False, repr=False)
+    _dict_cache: Dict = field(default=None, init=False, repr=False)
+
     def record_detection(self, detection_time: float, deadlock_found: bool):
         """Record a detection event"""
         self.total_detections += 1
+        if self.detection_times is None:
+            self.detection_times = deque(maxlen=TIMING_WINDOW)
+        elif len(self.detection_times) == self.detection_times.maxlen:
+            self._detection_window_sum -= self.detection_times[0]
         self.detection_times.append(detection_time)
+        self._detection_window_sum += detection_time
+        self._detection_time_total += detection_time
         if deadlock_found:
             self.deadlocks_found += 1
-    
+
     def record_recovery(self, recovery_time: float, terminated_count: int):
         """Record a recovery event"""
         self.total_recoveries += 1
+        if self.recovery_times is None:
+            self.recovery_times = deque(maxlen=TIMING_WINDOW)
+        elif len(self.recovery_times) == self.recovery_times.maxlen:
+            self._recovery_window_sum -= self.recovery_times[0]
         self.recovery_times.append(recovery_time)
+        self._recovery_window_sum += recovery_time
         self.processes_terminated += terminated_count
     
     def take_snapshot(self, controller):
         """Take a snapshot of current system state"""
+        # Reads the controller's incrementally maintained census, so a
+        # snapshot is O(1) instead of six walks over the process and
+        # resource tables
+        counts = controller._state_counts
         snapshot = MetricSnapshot(
-            timestamp=time.time(),
+            timestamp_ns=time.monotonic_ns(),
             iteration=controller.iteration,
             system_state=controller.system_state.state,
-            active_processes=sum(1 for p in controller.processes.values() 
-                               if p.state not in ['Terminated']),
-            blocked_processes=sum(1 for p in controller.processes.values() 
-                                if p.state == 'Blocked'),
-            deadlocked_processes=sum(1 for p in controller.processes.values() 
-                                   if p.state == 'Deadlocked'),
-            free_resources=sum(r.available_instances for r in controller.resources.values()),
-            allocated_resources=sum(r.total_instances - r.available_instances 
-                                  for r in controller.resources.values())
+            active_processes=sum(counts.values()) - counts['Terminated'],
+            blocked_processes=counts['Blocked'],
+            deadlocked_processes=counts['Deadlocked'],
+            free_resources=controller._free_instances,
+            allocated_resources=controller._allocated_instances
         )
+        if self.snapshots is None:
+            self.snapshots = SnapshotStore()
         self.snapshots.append(snapshot)
     
     def get_average_detection_time(self) -> float:
-        """Get average detection time in milliseconds"""
+        """Get average detection time in milliseconds (rolling window)"""
         if not self.detection_times:
             return 0.0
-        return sum(self.detection_times) / len(self.detection_times)
-    
+        return self._detection_window_sum / len(self.detection_times)
+
     def get_average_recovery_time(self) -> float:
-        """Get average recovery time in milliseconds"""
+        """Get average recovery time in milliseconds (rolling window)"""
         if not self.recovery_times:
             return 0.0
-        return sum(self.recovery_times) / len(self.recovery_times)
-    
+        return self._recovery_window_sum / len(self.recovery_times)
+
     def get_detection_overhead(self) -> float:
         """Get detection overhead as percentage of total time"""
         if self.simulation_duration == 0:
             return 0.0
-        total_detection_time = sum(self.detection_times)
-        return (total_detection_time / self.simulation_duration) * 100
+        return (self._detection_time_total / self.simulation_duration) * 100
     
     def to_dict(self) -> Dict:
         """Convert metrics to dictionary"""
-        return {
+        snapshots_taken = len(self.snapshots) if self.snapshots is not None else 0
+        key = (
+            self.total_detections, self.deadlocks_found,
+            self.false_positives, self.total_recoveries,
+            self.processes_terminated, self.total_iterations,
+            self.simulation_duration, snapshots_taken
+        )
+        if key == self._dict_key:
+            return self._dict_cache
+
+        self._dict_cache = {
             'detection': {
                 'total_detections': self.total_detections,
                 'deadlocks_found': self.deadlocks_found,
@@ -107,10 +225,12 @@ class PerformanceMetrics:
             'system': {
                 'total_iterations': self.total_iterations,
                 'simulation_duration_seconds': self.simulation_duration,
-                'snapshots_taken': len(self.snapshots)
+                'snapshots_taken': snapshots_taken
             }
         }
-    
+        self._dict_key = key
+        return self._dict_cache
+
     def __repr__(self):
         return (
             f"PerformanceMetrics(detections={self.total_detections}, "
@@ -0,0 +1,58 @@
+"""
+Shared pytest configuration and fixtures for the test suite
+"""
+import copy
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the repo root importable once for the whole suite, replacing the
+# per-module sys.path insert each test file used to run at import time
+_REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from src.simulation.controller import SimulationController, SimulationConfig
+
+
+def make_2x2_deadlock(config: SimulationConfig = None) -> SimulationController:
+    """
+    Build the standard two-process/two-resource circular deadlock
+
+    P1 holds R1 and waits for R2; P2 holds R2 and waits for R1. Several
+    test modules used to rebuild this scenario inline; sharing one
+    builder keeps the setups identical and in one place.
+    """
+    controller = SimulationController(config or SimulationConfig())
+    controller.add_processes([("P1", 5), ("P2", 5)])
+    controller.add_resources([("R1", 1), ("R2", 1)])
+    controller.batch_request([
+        ("P1", "R1"), ("P2", "R2"), ("P1", "R2"), ("P2", "R1")
+    ])
+    return controller
+
+
+@pytest.fixture(scope='session')
+def _deadlock_2x2_prototype():
+    """Default-config deadlocked state built once per session"""
+    return make_2x2_deadlock()
+
+
+@pytest.fixture
+def deadlocked_2x2(_deadlock_2x2_prototype):
+    """Fresh default-config 2x2 deadlock, cloned from the prototype"""
+    return copy.deepcopy(_deadlock_2x2_prototype)
+
+
+@pytest.fixture
+def immediate_deadlocked_2x2():
+    """2x2 deadlock built under the immediate detection strategy
+
+    Not prototype-cloned: with this strategy, detection (and recovery)
+    fire during the build itself, which is part of what its consumers
+    exercise.
+    """
+    return make_2x2_deadlock(
+        SimulationConfig(detection_strategy='immediate')
+    )
@@ -1,12 +1,6 @@
 """
 Basic tests for deadlock detection system
 """
-import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
-
 from src.core.process import Process
 from src.core.resource import Resource
 from src.simulation.controller import SimulationController, SimulationConfig
@@ -19,7 +13,6 @@ def test_process_creation():
     
     process.transition('start')
     assert process.state == 'Running'
-    print("✓ Process creation test passed")
 
 
 def test_resource_creation():
@@ -29,7 +22,6 @@ def test_resource_creation():
     
     resource.allocate("P1")
     assert resource.state == 'Allocated'
-    print("✓ Resource creation test passed")
 
 
 def test_simple_deadlock_detection():
@@ -56,7 +48,6 @@ def test_simple_deadlock_detection():
     
     assert result.deadlock_detected == True
     assert len(result.deadlocked_processes) == 2
-    print("✓ Deadlock detection test passed")
 
 
 def test_no_deadlock_scenario():
@@ -74,13 +65,15 @@ def test_no_deadlock_scenario():
     result = controller.detector.detect(controller.processes, controller.resources)
     
     assert result.deadlock_detected == False
-    print("✓ No deadlock test passed")
 
 
 if __name__ == '__main__':
-    print("Running tests...")
-    test_process_creation()
-    test_resource_creation()
-    test_simple_deadlock_detection()
-    test_no_deadlock_scenario()
-    print("\nAll tests passed!")
\ No newline at end of file
+    _TESTS = [
+        test_process_creation,
+        test_resource_creation,
+        test_simple_deadlock_detection,
+        test_no_deadlock_scenario,
+    ]
+    for _test in _TESTS:
+        _test()
+    print(f"{len(_TESTS)}/{len(_TESTS)} passed")
\ No newline at end of file
@@ -1,11 +1,6 @@
 """
 Unit tests for Finite State Automaton
 """
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
-
 from src.core.fsa import FiniteStateAutomaton, FSAException
 
 
@@ -29,7 +24,6 @@ def test_fsa_creation():
     
     assert fsa.current_state == 'S0'
     assert fsa.name == "TestFSA"
-    print("✓ FSA creation test passed")
 
 
 def test_fsa_transitions():
@@ -59,8 +53,6 @@ def test_fsa_transitions():
     
     fsa.transition('a')
     assert fsa.current_state == 'S0'
-    
-    print("✓ FSA transitions test passed")
 
 
 def test_fsa_invalid_transition():
@@ -84,8 +76,6 @@ def test_fsa_invalid_transition():
         assert False, "Should have raised FSAException"
     except FSAException:
         pass  # Expected
-    
-    print("✓ FSA invalid transition test passed")
 
 
 def test_fsa_reset():
@@ -101,17 +91,16 @@ def test_fsa_reset():
         states=states,
         alphabet=alphabet,
         transition_function=transitions,
-        initial_state='S0'
+        initial_state='S0',
+        record_history=True
     )
-    
+
     fsa.transition('a')
     assert fsa.current_state == 'S1'
-    
+
     fsa.reset()
     assert fsa.current_state == 'S0'
     assert len(fsa.transition_history) == 0
-    
-    print("✓ FSA reset test passed")
 
 
 def test_fsa_accepting_state():
@@ -139,15 +128,16 @@ def test_fsa_accepting_state():
     
     fsa.transition('b')
     assert fsa.is_in_accepting_state()
-    
-    print("✓ FSA accepting state test passed")
 
 
 if __name__ == '__main__':
-    print("Running FSA tests...\n")
-    test_fsa_creation()
-    test_fsa_transitions()
-    test_fsa_invalid_transition()
-    test_fsa_reset()
-    test_fsa_accepting_state()
-    print("\nAll FSA tests passed!")
\ No newline at end of file
+    _TESTS = [
+        test_fsa_creation,
+        test_fsa_transitions,
+        test_fsa_invalid_transition,
+        test_fsa_reset,
+        test_fsa_accepting_state,
+    ]
+    for _test in _TESTS:
+        _test()
+    print(f"{len(_TESTS)}/{len(_TESTS)} passed")
\ No newline at end of file
@@ -1,15 +1,31 @@
 """
 Unit tests for deadlock recovery
 """
-import sys
-from pathlib import Path
+import copy
 
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+import pytest
 
+from conftest import make_2x2_deadlock
 from src.simulation.controller import SimulationController, SimulationConfig
 from src.recovery.recovery import RecoveryModule
 
 
+@pytest.fixture(scope='module')
+def _cost_deadlock_prototype():
+    """Deadlocked state built once per module; tests get deepcopies"""
+    return make_2x2_deadlock(SimulationConfig(recovery_strategy='cost'))
+
+
+@pytest.fixture
+def cost_deadlocked_controller(_cost_deadlock_prototype):
+    """Fresh deadlocked controller, cloned from the shared prototype
+
+    deepcopy of the small object graph is cheaper than re-running the
+    whole allocate/block FSA path for every test.
+    """
+    return copy.deepcopy(_cost_deadlock_prototype)
+
+
 def test_recovery_with_priority_strategy():
     """Test recovery using priority-based victim selection"""
     config = SimulationConfig(recovery_strategy='priority')
@@ -40,8 +56,6 @@ def test_recovery_with_priority_strategy():
     assert recovery_result.success == True
     assert 'P2' in recovery_result.victims
     assert controller.processes['P2'].state == 'Terminated'
-    
-    print("✓ Priority-based recovery test passed")
 
 
 def test_recovery_with_cost_strategy():
@@ -68,25 +82,12 @@ def test_recovery_with_cost_strategy():
     
     assert recovery_result.success == True
     assert len(recovery_result.victims) > 0
-    
-    print("✓ Cost-based recovery test passed")
 
 
-def test_resource_release_after_recovery():
+def test_resource_release_after_recovery(cost_deadlocked_controller):
     """Test that resources are released after recovery"""
-    config = SimulationConfig(recovery_strategy='cost')
-    controller = SimulationController(config)
-    
-    controller.add_process("P1", priority=5)
-    controller.add_process("P2", priority=5)
-    controller.add_resource("R1", instances=1)
-    controller.add_resource("R2", instances=1)
-    
-    controller.request_resource("P1", "R1")
-    controller.request_resource("P2", "R2")
-    controller.request_resource("P1", "R2")
-    controller.request_resource("P2", "R1")
-    
+    controller = cost_deadlocked_controller
+
     # Before recovery
     assert controller.resources['R1'].available_instances == 0
     assert controller.resources['R2'].available_instances == 0
@@ -103,26 +104,12 @@ def test_resource_release_after_recovery():
     total_available = (controller.resources['R1'].available_instances + 
                       controller.resources['R2'].available_instances)
     assert total_available > 0
-    
-    print("✓ Resource release after recovery test passed")
 
 
-def test_multiple_recoveries():
+def test_multiple_recoveries(cost_deadlocked_controller):
     """Test system handling multiple recovery cycles"""
-    config = SimulationConfig(recovery_strategy='cost')
-    controller = SimulationController(config)
-    
-    controller.add_process("P1", priority=5)
-    controller.add_process("P2", priority=5)
-    controller.add_resource("R1", instances=1)
-    controller.add_resource("R2", instances=1)
-    
-    # First deadlock
-    controller.request_resource("P1", "R1")
-    controller.request_resource("P2", "R2")
-    controller.request_resource("P1", "R2")
-    controller.request_resource("P2", "R1")
-    
+    controller = cost_deadlocked_controller
+
     result1 = controller.detector.detect(controller.processes, controller.resources)
     recovery1 = controller.recovery.recover(
         controller.processes,
@@ -132,25 +119,12 @@ def test_multiple_recoveries():
     
     assert recovery1.success == True
     assert controller.recovery.recovery_count == 1
-    
-    print("✓ Multiple recoveries test passed")
 
 
-def test_victim_count_tracking():
+def test_victim_count_tracking(cost_deadlocked_controller):
     """Test that victim count is tracked for starvation prevention"""
-    config = SimulationConfig(recovery_strategy='cost')
-    controller = SimulationController(config)
-    
-    controller.add_process("P1", priority=5)
-    controller.add_process("P2", priority=5)
-    controller.add_resource("R1", instances=1)
-    controller.add_resource("R2", instances=1)
-    
-    controller.request_resource("P1", "R1")
-    controller.request_resource("P2", "R2")
-    controller.request_resource("P1", "R2")
-    controller.request_resource("P2", "R1")
-    
+    controller = cost_deadlocked_controller
+
     result = controller.detector.detect(controller.processes, controller.resources)
     recovery_result = controller.recovery.recover(
         controller.processes,
@@ -161,15 +135,8 @@ def test_victim_count_tracking():
     # Check victim count increased
     victim_pid = recovery_result.victims[0]
     assert controller.processes[victim_pid].victim_count > 0
-    
-    print("✓ Victim count tracking test passed")
 
 
 if __name__ == '__main__':
-    print("Running recovery tests...\n")
-    test_recovery_with_priority_strategy()
-    test_recovery_with_cost_strategy()
-    test_resource_release_after_recovery()
-    test_multiple_recoveries()
-    test_victim_count_tracking()
-    print("\nAll recovery tests passed!")
\ No newline at end of file
+    # Fixture-based tests need the pytest runner
+    raise SystemExit(pytest.main([__file__]))
\ No newline at end of file
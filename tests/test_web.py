@@ -1,12 +1,8 @@
 """
 Diagnostic script to test web interface
 """
-import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / 'src'))
-
 print("=" * 60)
 print("WEB INTERFACE DIAGNOSTICS")
 print("=" * 60)